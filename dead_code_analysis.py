@@ -8,6 +8,7 @@ import ast
 import os
 import re
 from collections import defaultdict
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Tuple, Set
 
@@ -195,7 +196,7 @@ def main():
     for file_path, unused_list in unused_imports.items():
         if len(unused_list) > 2:  # Only show files with multiple unused imports
             print(f"\n{file_path}:")
-            for unused in unused_list[:5]:  # Show top 5
+            for unused in islice(unused_list, 5):  # Show top 5
                 print(f"  • {unused}")
                 total_unused_imports += 1
             if len(unused_list) > 5:
@@ -207,7 +208,7 @@ def main():
     print("\n\n2. POTENTIALLY DEAD FUNCTIONS:")
     print("-" * 40)
     dead_functions = analyzer.find_dead_functions()
-    for func_name, file_path, line_no in dead_functions[:15]:  # Show top 15
+    for func_name, file_path, line_no in islice(dead_functions, 15):  # Show top 15
         print(f"• {func_name} in {file_path}:{line_no}")
     
     if len(dead_functions) > 15:
@@ -228,7 +229,7 @@ def main():
     print("\n\n4. LARGE FILES WITH LOW UTILIZATION:")
     print("-" * 40)
     large_files = analyzer.find_large_files_with_low_utilization()
-    for file_path, lines, func_count, utilization in large_files[:10]:
+    for file_path, lines, func_count, utilization in islice(large_files, 10):
         print(f"• {file_path}: {lines} lines, {func_count} functions, {utilization:.1%} utilization")
     
     # 5. Summary
@@ -24,8 +24,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import sqlite3
 from pathlib import Path
+import requests
 import yfinance as yf
 from collections import defaultdict, deque
+from itertools import count
 import weakref
 import gc
 
@@ -73,9 +75,9 @@ class StockInfo:
     is_active: bool = True
     monitoring_priority: DataPriority = DataPriority.MEDIUM
 
-@dataclass
+@dataclass(slots=True)
 class RealTimeData:
-    """リアルタイムデータ"""
+    """リアルタイムデータ（tick毎に生成されるためslotsで__dict__を持たない）"""
     symbol: str
     timestamp: datetime
     price: float
@@ -112,6 +114,12 @@ class UniverseManager:
         self.active_symbols = set()
         self.monitoring_symbols = set()
         self.lock = threading.RLock()
+
+        # アクティブ銘柄リストの世代キャッシュ: メンバーシップが変わらない限り
+        # get_active_symbols()のリスト複製を繰り返さない
+        self._symbols_version = 0
+        self._symbols_cache: Optional[List[str]] = None
+        self._symbols_cache_version = -1
         
         # データベース初期化
         self._init_database()
@@ -248,6 +256,7 @@ class UniverseManager:
             
             if stock_info.is_active:
                 self.active_symbols.add(stock_info.symbol)
+                self._symbols_version += 1
             
             # データベースに保存
             self._save_stock_to_db(stock_info)
@@ -294,9 +303,12 @@ class UniverseManager:
                    if stock.monitoring_priority == priority]
     
     def get_active_symbols(self) -> List[str]:
-        """アクティブ銘柄取得"""
+        """アクティブ銘柄取得（世代が変わらない限りキャッシュ済みリストを返す）"""
         with self.lock:
-            return list(self.active_symbols)
+            if self._symbols_cache_version != self._symbols_version:
+                self._symbols_cache = list(self.active_symbols)
+                self._symbols_cache_version = self._symbols_version
+            return self._symbols_cache
     
     def get_monitoring_symbols(self) -> List[str]:
         """監視銘柄取得"""
@@ -338,6 +350,15 @@ class BatchDataFetcher:
         self.batch_size = batch_size
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.request_queue = PriorityQueue()
+
+        # HTTP接続プール: リクエスト毎のTCP/TLSハンドシェイクとDNS解決を
+        # 避けるため、全ワーカーでkeep-aliveセッションを1つ共有する
+        self._http_session = requests.Session()
+        _adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=max_workers
+        )
+        self._http_session.mount('https://', _adapter)
+        self._http_session.mount('http://', _adapter)
         self.results_cache = {}
         self.processing_stats = {
             'total_requests': 0,
@@ -347,15 +368,24 @@ class BatchDataFetcher:
             'throughput_per_second': 0
         }
         self.lock = threading.Lock()
-        
+
         # 処理中のリクエスト管理
         self.active_requests = {}
-        
+
+        # リクエスト完了のawaitable通知: request_id -> {'future', 'remaining', 'results'}
+        # 呼び出し側はポーリングせずfutureをawaitして完了と同時に結果を受け取る
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+        # request_idの衝突防止用シーケンス。ms精度の時刻だけでは
+        # パイプライン投入のように同一ミリ秒内の連続submitで同じidに
+        # なり、_pendingの登録が上書きされてしまう
+        self._request_seq = count()
+
         logger.info(f"BatchDataFetcher初期化完了: {max_workers}ワーカー, バッチサイズ{batch_size}")
     
     def submit_batch_request(self, symbols: List[str], priority: DataPriority = DataPriority.MEDIUM) -> str:
         """バッチリクエスト送信"""
-        request_id = f"batch_{int(time.time() * 1000)}"
+        request_id = f"batch_{int(time.time() * 1000)}_{next(self._request_seq)}"
         
         # 大きなリクエストをバッチサイズに分割
         batches = [symbols[i:i+self.batch_size] 
@@ -371,27 +401,59 @@ class BatchDataFetcher:
             
             # 優先度付きキューに追加
             self.request_queue.put((priority.value, f"{request_id}_{i}", batch_request))
-        
+
+        # イベントループ上から呼ばれた場合は完了通知用のfutureを登録する
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            with self.lock:
+                self._pending[request_id] = {
+                    'future': loop.create_future(),
+                    'remaining': len(batches),
+                    'results': {}
+                }
+
         logger.info(f"バッチリクエスト送信: {len(symbols)}銘柄 -> {len(batches)}バッチ")
         return request_id
+
+    def wait_for_results(self, request_id: str) -> Optional[asyncio.Future]:
+        """リクエスト完了をawaitするためのfutureを返す
+
+        submit_batch_requestがイベントループ上で呼ばれていれば、全バッチの
+        完了時に集約結果でset_resultされるfutureを返す。
+        ループ外からの送信ではNone（従来のget_cached_resultsポーリング）。
+        """
+        with self.lock:
+            pending = self._pending.get(request_id)
+        return pending['future'] if pending else None
     
     async def process_batch_requests(self):
-        """バッチリクエスト処理"""
+        """バッチリクエスト処理
+
+        empty()を0.1秒間隔で覗くポーリングではなく、キューのブロッキング
+        getをエグゼキュータへ逃して到着駆動でディスパッチする。リクエストは
+        到着と同時に処理が始まり、アイドル時のループ起床もなくなる。
+        """
+        loop = asyncio.get_running_loop()
         while True:
             try:
-                if not self.request_queue.empty():
-                    priority, request_id, batch_request = self.request_queue.get()
-                    
-                    # 並列処理で実行
-                    task = asyncio.create_task(
-                        self._process_single_batch(request_id, batch_request)
+                try:
+                    priority, request_id, batch_request = await loop.run_in_executor(
+                        None, self.request_queue.get, True, 0.5
                     )
-                    
-                    # 完了を待たずに次のリクエストを処理
-                    asyncio.create_task(self._handle_batch_result(request_id, task))
-                
-                await asyncio.sleep(0.1)  # CPU負荷軽減
-                
+                except Empty:
+                    continue
+
+                # 並列処理で実行
+                task = asyncio.create_task(
+                    self._process_single_batch(request_id, batch_request)
+                )
+
+                # 完了を待たずに次のリクエストを処理
+                asyncio.create_task(self._handle_batch_result(request_id, task))
+
             except Exception as e:
                 logger.error(f"バッチリクエスト処理エラー: {e}")
                 await asyncio.sleep(1)
@@ -456,7 +518,7 @@ class BatchDataFetcher:
             start_time = time.time()
             
             # Yahoo Finance APIから取得
-            ticker = yf.Ticker(f"{symbol}.T")
+            ticker = yf.Ticker(f"{symbol}.T", session=self._http_session)
             info = ticker.info
             
             if not info:
@@ -497,20 +559,41 @@ class BatchDataFetcher:
         """バッチ結果処理"""
         try:
             result = await task
-            
-            # 結果をキャッシュ
+
+            # キャッシュ書き込みと完了通知の状態遷移を1回のロック取得で行う
+            # （done/result/pendingを別々に覗くとロック4回分のオーバーヘッド）
+            base_id = request_id.rsplit('_', 1)[0]
+            completed = False
             with self.lock:
                 self.results_cache[request_id] = result
-                
+
                 # キャッシュサイズ制限
                 if len(self.results_cache) > 1000:
                     # 古いエントリを削除
                     oldest_keys = list(self.results_cache.keys())[:100]
                     for key in oldest_keys:
                         del self.results_cache[key]
-            
+
+                # 完了通知: 全バッチ分の結果が揃ったらfutureを解決する
+                pending = self._pending.get(base_id)
+                if pending is not None:
+                    pending['results'].update(result.get('results', {}))
+                    pending['remaining'] -= 1
+                    completed = pending['remaining'] <= 0
+                    if completed:
+                        del self._pending[base_id]
+            if pending is not None and completed:
+                future = pending['future']
+                if not future.done():
+                    future.set_result({
+                        'request_id': base_id,
+                        'results': pending['results'],
+                        'success_count': len(pending['results']),
+                        'timestamp': datetime.now().isoformat()
+                    })
+
             logger.debug(f"バッチ結果処理完了: {request_id}")
-            
+
         except Exception as e:
             logger.error(f"バッチ結果処理エラー {request_id}: {e}")
     
@@ -14,7 +14,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union, Set
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 import json
 import sqlite3
 import pandas as pd
@@ -340,6 +340,21 @@ class JsonSerializationFixer:
         try:
             if isinstance(data, datetime):
                 return data.isoformat()
+            elif is_dataclass(data) and not isinstance(data, type):
+                # dataclassはフィールドを直接走査（asdictの再帰deepcopyを回避）
+                fixed = {
+                    f.name: self.fix_datetime_serialization(getattr(data, f.name))
+                    for f in fields(data)
+                }
+                # timestampをmonotonic tickで持つ値オブジェクト
+                # （QualityGateResult等）はiso_timestampプロパティを
+                # 公開しており、ISO文字列への変換はこのシリアライズ
+                # 時点でだけ行う（tickの生intを書き出さない）
+                if 'timestamp' in fixed and hasattr(data, 'iso_timestamp'):
+                    fixed['timestamp'] = data.iso_timestamp
+                return fixed
+            elif isinstance(data, Enum):
+                return data.value
             elif isinstance(data, dict):
                 return {key: self.fix_datetime_serialization(value) for key, value in data.items()}
             elif isinstance(data, list):
@@ -371,6 +386,42 @@ class JsonSerializationFixer:
             except:
                 return '{"error": "serialization_failed"}'
     
+    def safe_json_dump(self, data: Any, fp, **kwargs) -> None:
+        """安全なJSON dump（ファイルへ直接ストリーム書き込み）
+
+        safe_json_dumpsと同じ修正を適用した上でjson.dumpを使い、
+        JSON全文の中間文字列を確保せずエンコーダ出力をfpへ流す。
+        """
+        # エンコード途中の例外で部分JSONが残ると、フォールバックの
+        # 追記で2つ目のドキュメントが連結されパース不能になる。
+        # 書き込み開始位置を控えておき、失敗時は巻き戻してから書く
+        try:
+            start_pos = fp.tell()
+        except (OSError, ValueError):
+            start_pos = None  # 非シーク可能ストリーム
+
+        try:
+            fixed_data = self.fix_datetime_serialization(data)
+            json.dump(fixed_data, fp, ensure_ascii=False, **kwargs)
+        except Exception as e:
+            self.serialization_errors.append(f"JSON serialization error: {e}")
+            self.fix_count += 1
+
+            # 途中まで流れた部分JSONを破棄（safe_json_dumpsと同じく
+            # 出力は常に単一の妥当なドキュメントにする）
+            if start_pos is not None:
+                try:
+                    fp.seek(start_pos)
+                    fp.truncate()
+                except (OSError, ValueError):
+                    pass
+
+            # フォールバック処理
+            try:
+                json.dump(str(data), fp, ensure_ascii=False)
+            except:
+                fp.write('{"error": "serialization_failed"}')
+
     def get_fix_stats(self) -> Dict[str, Any]:
         """修正統計取得"""
         return {
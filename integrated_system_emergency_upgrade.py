@@ -10,47 +10,58 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 import asyncio
+import atexit
+import functools
 import logging
+import queue
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union, Set, Tuple
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime
+from typing import Dict, Any, Final, Optional, List, Tuple
 from enum import Enum
-from dataclasses import dataclass, field
-import json
-import sqlite3
-import pandas as pd
+from dataclasses import dataclass, asdict
+from statistics import fmean
+import multiprocessing
 import numpy as np
 from pathlib import Path
-import traceback
-from collections import defaultdict, deque
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed, ProcessPoolExecutor
-import multiprocessing
-import psutil
-import weakref
-import gc
-from contextlib import asynccontextmanager
+from collections import OrderedDict
 import aiohttp
 # import asyncpg  # 不要なライブラリをコメントアウト
 # from aiofiles import open as aio_open
 
 # 既存システムのインポート
-from emergency_data_correction_system import (
-    DelistedStockFilter, JsonSerializationFixer, KabuApiEnhancer, 
-    DataQualityChecker, EmergencyDataCorrectionSystem
-)
+from emergency_data_correction_system import JsonSerializationFixer
 
-# ログ設定
+# ログ設定: ディスク書き込みをイベントループスレッドから切り離すため、
+# ロガーにはQueueHandlerのみを挿し、実際のIOはQueueListenerの
+# バックグラウンドスレッドに委譲する
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('integrated_system_emergency.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('integrated_system_emergency.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
+)
+_log_listener = QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# uvloopが入っていればlibuvベースのイベントループで高頻度スケジューリングを高速化
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+# 共有乱数生成器（PCG64）: シミュレーション用の一様乱数をバッチで引く
+_rng = np.random.default_rng()
+
 class EmergencyLevel(Enum):
     """緊急レベル"""
     NORMAL = "normal"
@@ -91,31 +102,153 @@ class IntegrationMetrics:
     cpu_usage_percent: float
     connection_count: int
 
-@dataclass
+class MetricRingBuffer:
+    """統合メトリクス履歴のSoAリングバッファ
+
+    IntegrationMetricsオブジェクトのリスト保持はスナップショット毎に
+    9属性のポインタ追跡とGC負荷を伴うため、履歴は列ごとの事前確保
+    NumPy配列に書き込む。移動平均などの集計はPythonオブジェクト走査
+    でなくC実装のリダクション一回で完了する。
+    """
+
+    _COMPONENT_INDEX = {component: i for i, component in enumerate(SystemComponent)}
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self._head = 0
+        self._count = 0
+        self._timestamp = np.zeros(capacity, dtype='datetime64[ns]')
+        self._component = np.zeros(capacity, dtype=np.uint8)
+        self._success_rate = np.zeros(capacity, dtype=np.float32)
+        self._response_time_ms = np.zeros(capacity, dtype=np.float32)
+        self._error_count = np.zeros(capacity, dtype=np.uint32)
+        self._throughput = np.zeros(capacity, dtype=np.float32)
+        self._memory_usage_mb = np.zeros(capacity, dtype=np.float32)
+        self._cpu_usage_percent = np.zeros(capacity, dtype=np.float32)
+        self._connection_count = np.zeros(capacity, dtype=np.uint32)
+
+    def record(self, metrics: 'IntegrationMetrics'):
+        """スナップショットをリングバッファの現在スロットへ書き込む"""
+        slot = self._head % self.capacity
+        self._timestamp[slot] = np.datetime64(metrics.timestamp)
+        self._component[slot] = self._COMPONENT_INDEX[metrics.component]
+        self._success_rate[slot] = metrics.success_rate
+        self._response_time_ms[slot] = metrics.response_time_ms
+        self._error_count[slot] = metrics.error_count
+        self._throughput[slot] = metrics.throughput
+        self._memory_usage_mb[slot] = metrics.memory_usage_mb
+        self._cpu_usage_percent[slot] = metrics.cpu_usage_percent
+        self._connection_count[slot] = metrics.connection_count
+        self._head += 1
+        self._count = min(self._count + 1, self.capacity)
+
+    def mean_success_rate(self) -> float:
+        """保持中スナップショットの平均成功率"""
+        if self._count == 0:
+            return 0.0
+        return float(self._success_rate[:self._count].mean())
+
+    def mean_response_time_ms(self) -> float:
+        """保持中スナップショットの平均応答時間(ms)"""
+        if self._count == 0:
+            return 0.0
+        return float(self._response_time_ms[:self._count].mean())
+
+    def total_errors(self) -> int:
+        """保持中スナップショットのエラー総数"""
+        return int(self._error_count[:self._count].sum())
+
+# monotonic時刻をエポック時刻へ写像するオフセット（プロセス起動時に1度だけ測る）
+_MONO_EPOCH_OFFSET_NS: Final[int] = time.time_ns() - time.monotonic_ns()
+
+@dataclass(slots=True, frozen=True)
 class QualityGateResult:
-    """品質ゲート結果"""
+    """品質ゲート結果（不変の値オブジェクト）
+
+    slotsで__dict__を持たないためインスタンスメモリが約半分になり、
+    属性アクセスはスロットディスクリプタ経由のC実装になる。
+    timestampはtime.monotonic_ns()のtick。datetimeオブジェクトの生成を
+    ゲート実行のホットパスから排除し、ISO文字列はシリアライズ時に
+    iso_timestampで遅延生成する。
+    """
     gate: QualityGate
     passed: bool
     score: float
     details: Dict[str, Any]
-    timestamp: datetime
+    timestamp: int
     recommendations: List[str]
 
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO 8601形式のタイムスタンプ（要求時のみ変換）"""
+        epoch_ns = self.timestamp + _MONO_EPOCH_OFFSET_NS
+        return datetime.fromtimestamp(epoch_ns / 1e9).isoformat()
+
+@dataclass(slots=True)
+class OptimizationStats:
+    """データ統合最適化の累積統計（slotsでdict参照を排した固定フィールド）"""
+    connections_optimized: int = 0
+    latency_reduced: int = 0
+    throughput_improved: int = 0
+    sync_errors_fixed: int = 0
+
+@dataclass(slots=True)
+class SyncMetrics:
+    """並列同期メトリクス（ホットパスで更新するためslots属性アクセス）"""
+    total_syncs: int = 0
+    successful_syncs: int = 0
+    failed_syncs: int = 0
+    sync_latency_ms: float = 0.0
+    data_consistency_score: float = 0.0
+    buffer_size: int = 0
+
+@dataclass(slots=True)
+class StabilizationMetrics:
+    """kabu API安定化メトリクス（リクエスト毎更新のためslots属性アクセス）"""
+    requests_processed: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    avg_response_time: float = 0.0
+    semaphore_waits_ms: float = 0.0
+    cache_hits: int = 0
+    stability_score: float = 0.0
+
+@dataclass(slots=True)
+class UniverseIntegrationMetrics:
+    """ユニバース統合メトリクス"""
+    symbols_integrated: int = 0
+    sync_success_rate: float = 0.0
+    data_consistency: float = 0.0
+    update_frequency: float = 0.0
+    integration_health: float = 0.0
+
 class DataIntegrationOptimizer:
     """データ統合連携最適化システム"""
     
-    def __init__(self):
-        self.connection_pool = None
-        self.optimization_stats = {
-            'connections_optimized': 0,
-            'latency_reduced': 0,
-            'throughput_improved': 0,
-            'sync_errors_fixed': 0
-        }
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = config or {}
+        # 共有コネクションプール: リクエスト毎のセッション生成を避け、
+        # DNSキャッシュとKeep-aliveを全呼び出し元で共有する
+        self._connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            ttl_dns_cache=300,
+            keepalive_timeout=600
+        )
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=aiohttp.ClientTimeout(total=5)
+        )
+        self.connection_pool = self.session
+        self.optimization_stats = OptimizationStats()
         self.active_connections = {}
         self.connection_health = {}
-        
+
         logger.info("DataIntegrationOptimizer初期化完了")
+
+    async def close(self):
+        """共有セッションのクローズ"""
+        await self.session.close()
     
     async def optimize_data_integration(self) -> Dict[str, Any]:
         """データ統合連携最適化"""
@@ -138,7 +271,7 @@ class DataIntegrationOptimizer:
             'data_sync_optimized': True,
             'latency_optimized': True,
             'throughput_optimized': True,
-            'stats': self.optimization_stats
+            'stats': asdict(self.optimization_stats)
         }
         
         logger.info("=== データ統合連携最適化完了 ===")
@@ -146,105 +279,112 @@ class DataIntegrationOptimizer:
     
     async def _optimize_connection_pool(self):
         """コネクションプール最適化"""
-        try:
-            # 最適化されたコネクションプール設定
-            pool_config = {
-                'min_size': 10,
-                'max_size': 100,
-                'command_timeout': 5,
-                'server_settings': {
-                    'application_name': 'tradeflow_emergency',
-                    'tcp_keepalives_idle': '600',
-                    'tcp_keepalives_interval': '30',
-                    'tcp_keepalives_count': '3'
-                }
+        # 最適化されたコネクションプール設定
+        pool_config = {
+            'min_size': 10,
+            'max_size': 100,
+            'command_timeout': 5,
+            'server_settings': {
+                'application_name': 'tradeflow_emergency',
+                'tcp_keepalives_idle': '600',
+                'tcp_keepalives_interval': '30',
+                'tcp_keepalives_count': '3'
             }
-            
-            self.optimization_stats['connections_optimized'] += 1
-            logger.info("コネクションプール最適化完了")
-            
-        except Exception as e:
-            logger.error(f"コネクションプール最適化エラー: {e}")
+        }
+        
+        self.optimization_stats.connections_optimized += 1
+        logger.info("コネクションプール最適化完了")
     
     async def _optimize_data_synchronization(self):
         """データ同期最適化"""
-        try:
-            # バッチ処理最適化
-            batch_sizes = [10, 20, 50, 100]
-            optimal_batch_size = 50
-            
-            # 並列処理最適化
-            optimal_workers = min(multiprocessing.cpu_count() * 2, 100)
-            
-            self.optimization_stats['sync_errors_fixed'] += 1
-            logger.info(f"データ同期最適化完了: バッチサイズ{optimal_batch_size}, ワーカー数{optimal_workers}")
-            
-        except Exception as e:
-            logger.error(f"データ同期最適化エラー: {e}")
+        # バッチ処理最適化
+        batch_sizes = [10, 20, 50, 100]
+        optimal_batch_size = 50
+        
+        # 並列処理最適化（IOバウンドのためコア数でなく設定値でサイジング）
+        optimal_workers = self.config.get('io_workers', 10)
+        
+        self.optimization_stats.sync_errors_fixed += 1
+        logger.info("データ同期最適化完了: バッチサイズ%s, ワーカー数%s", optimal_batch_size, optimal_workers)
     
     async def _optimize_latency(self):
         """レイテンシ最適化"""
-        try:
-            # キャッシュ最適化
-            cache_settings = {
-                'ttl': 60,  # 1分
-                'max_size': 10000,
-                'eviction_policy': 'lru'
-            }
-            
-            # 圧縮最適化
-            compression_settings = {
-                'enabled': True,
-                'algorithm': 'gzip',
-                'level': 6
-            }
-            
-            self.optimization_stats['latency_reduced'] += 50  # 50ms削減
-            logger.info("レイテンシ最適化完了: 50ms削減")
-            
-        except Exception as e:
-            logger.error(f"レイテンシ最適化エラー: {e}")
+        # キャッシュ最適化
+        cache_settings = {
+            'ttl': 60,  # 1分
+            'max_size': 10000,
+            'eviction_policy': 'lru'
+        }
+        
+        # 圧縮最適化
+        compression_settings = {
+            'enabled': True,
+            'algorithm': 'gzip',
+            'level': 6
+        }
+        
+        self.optimization_stats.latency_reduced += 50  # 50ms削減
+        logger.info("レイテンシ最適化完了: 50ms削減")
     
     async def _optimize_throughput(self):
         """スループット最適化"""
-        try:
-            # 並列処理最適化
-            semaphore_size = 100
-            
-            # バッファリング最適化
-            buffer_settings = {
-                'size': 1000,
-                'flush_interval': 1000,  # 1秒
-                'batch_size': 100
-            }
-            
-            self.optimization_stats['throughput_improved'] += 25  # 25%改善
-            logger.info("スループット最適化完了: 25%改善")
-            
-        except Exception as e:
-            logger.error(f"スループット最適化エラー: {e}")
+        # 並列処理最適化
+        semaphore_size = 100
+        
+        # バッファリング最適化
+        buffer_settings = {
+            'size': 1000,
+            'flush_interval': 1000,  # 1秒
+            'batch_size': 100
+        }
+        
+        self.optimization_stats.throughput_improved += 25  # 25%改善
+        logger.info("スループット最適化完了: 25%改善")
 
 class ParallelDataSyncEnhancer:
     """50並列データ取得と他システムとの同期改善"""
-    
+
+    # 整合性チェック項目（現状は全項目が定義のみ=常時合格。実チェック実装時は
+    # passed/len で再計算すること）
+    _CONSISTENCY_CHECK_NAMES: Tuple[str, ...] = (
+        'timestamp_consistency',
+        'data_completeness',
+        'reference_integrity',
+        'duplicate_detection'
+    )
+
+    # 1回のキュー取得でまとめて処理する最大タスク数
+    _DRAIN_BATCH_SIZE = 32
+
     def __init__(self):
-        self.sync_metrics = {
-            'total_syncs': 0,
-            'successful_syncs': 0,
-            'failed_syncs': 0,
-            'sync_latency_ms': 0,
-            'data_consistency_score': 0.0
-        }
+        self.sync_metrics = SyncMetrics()
         self.sync_queue = asyncio.Queue(maxsize=1000)
         self.sync_workers = []
+        self.sync_semaphore: Optional[asyncio.Semaphore] = None
         self.running = False
+        # レイテンシ標本のリングバッファ: ホットパスではメモリ書き込み1回のみ、
+        # EMA計算はバッファ一周ごとにベクトル化して行う
+        self._lat_buf = np.zeros(1024, dtype=np.float32)
+        self._lat_idx = 0
         
         logger.info("ParallelDataSyncEnhancer初期化完了")
     
-    async def enhance_parallel_sync(self, target_parallelism: int = 50) -> Dict[str, Any]:
-        """並列データ同期強化"""
-        logger.info(f"=== 並列データ同期強化開始: {target_parallelism}並列 ===")
-        
+    async def enhance_parallel_sync(self, target_parallelism: int = 50,
+                                    buffer_size: Optional[int] = None) -> Dict[str, Any]:
+        """並列データ同期強化
+
+        buffer_sizeはステージ間キューのバッファ長。未指定時はリトルの法則に
+        基づきワーカーあたり約2件のインフライトを確保する 2*target_parallelism
+        （下限64）を採用する。
+        """
+        if buffer_size is None:
+            buffer_size = max(2 * target_parallelism, 64)
+        logger.info("=== 並列データ同期強化開始: %s並列 / バッファ%s ===", target_parallelism, buffer_size)
+
+        # ワーカー起動前にキューをバッファ長に合わせて再構築
+        self.sync_queue = asyncio.Queue(maxsize=buffer_size)
+        self.sync_metrics.buffer_size = buffer_size
+
         # 1. 並列処理最適化
         await self._optimize_parallel_processing(target_parallelism)
         
@@ -262,7 +402,7 @@ class ParallelDataSyncEnhancer:
             'sync_mechanism_enhanced': True,
             'data_consistency_ensured': True,
             'error_handling_enhanced': True,
-            'metrics': self.sync_metrics
+            'metrics': asdict(self.sync_metrics)
         }
         
         logger.info("=== 並列データ同期強化完了 ===")
@@ -270,38 +410,52 @@ class ParallelDataSyncEnhancer:
     
     async def _optimize_parallel_processing(self, target_parallelism: int):
         """並列処理最適化"""
-        try:
-            # セマフォ最適化
-            semaphore = asyncio.Semaphore(target_parallelism)
-            
-            # ワーカープール最適化
-            self.sync_workers = [
-                asyncio.create_task(self._sync_worker(semaphore))
-                for _ in range(target_parallelism)
-            ]
-            
-            # 並列処理メトリクス
-            self.sync_metrics['total_syncs'] += target_parallelism
-            
-            logger.info(f"並列処理最適化完了: {target_parallelism}並列")
-            
-        except Exception as e:
-            logger.error(f"並列処理最適化エラー: {e}")
+        # セマフォ最適化（ワーカー全員で1インスタンスを共有）
+        self.sync_semaphore = asyncio.Semaphore(target_parallelism)
+
+        # ワーカープール最適化
+        self.sync_workers = [
+            asyncio.create_task(self._sync_worker(self.sync_semaphore))
+            for _ in range(target_parallelism)
+        ]
+        
+        # 並列処理メトリクス
+        self.sync_metrics.total_syncs += target_parallelism
+        
+        logger.info("並列処理最適化完了: %s並列", target_parallelism)
     
     async def _sync_worker(self, semaphore: asyncio.Semaphore):
-        """同期ワーカー"""
-        while self.running:
-            try:
-                async with semaphore:
-                    # 同期タスクの実行
-                    task = await asyncio.wait_for(self.sync_queue.get(), timeout=1.0)
-                    await self._process_sync_task(task)
-                    
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                logger.error(f"同期ワーカーエラー: {e}")
-                self.sync_metrics['failed_syncs'] += 1
+        """同期ワーカー（None番兵を受信するまでキューをバッチでドレイン消費）
+
+        1件ごとにイベントループへ戻らず、キューに溜まっている分を最大
+        _DRAIN_BATCH_SIZE件まとめて引き抜き、セマフォもバッチ単位で
+        1回だけ取得してタスク毎のスケジューラ往復を償却する。
+        """
+        while True:
+            batch = [await self.sync_queue.get()]
+            while (not self.sync_queue.empty()
+                   and len(batch) < self._DRAIN_BATCH_SIZE):
+                batch.append(self.sync_queue.get_nowait())
+
+            stopping = False
+            async with semaphore:
+                for task in batch:
+                    if task is None:
+                        # 停止番兵: 自分の分は消費し、余分に引いた分は他ワーカーへ返す
+                        self.sync_queue.task_done()
+                        if stopping:
+                            self.sync_queue.put_nowait(None)
+                        stopping = True
+                        continue
+                    try:
+                        await self._process_sync_task(task)
+                    except Exception as e:
+                        logger.error("同期ワーカーエラー: %s", e)
+                        self.sync_metrics.failed_syncs += 1
+                    finally:
+                        self.sync_queue.task_done()
+            if stopping:
+                break
     
     async def _process_sync_task(self, task: Dict[str, Any]):
         """同期タスク処理"""
@@ -311,100 +465,173 @@ class ParallelDataSyncEnhancer:
             # 同期処理の実行
             await asyncio.sleep(0.01)  # 同期処理シミュレート
             
-            # メトリクス更新
+            # メトリクス更新（ホットパスは標本の書き込みのみ）
             sync_time = (time.time() - start_time) * 1000
-            self.sync_metrics['sync_latency_ms'] = (
-                self.sync_metrics['sync_latency_ms'] * 0.9 + sync_time * 0.1
-            )
-            self.sync_metrics['successful_syncs'] += 1
+            self._lat_buf[self._lat_idx % 1024] = sync_time
+            self._lat_idx += 1
+            if self._lat_idx % 1024 == 0:
+                self._flush_latency_metrics()
+            self.sync_metrics.successful_syncs += 1
             
         except Exception as e:
-            logger.error(f"同期タスク処理エラー: {e}")
-            self.sync_metrics['failed_syncs'] += 1
+            logger.error("同期タスク処理エラー: %s", e)
+            self.sync_metrics.failed_syncs += 1
     
+    def _flush_latency_metrics(self):
+        """蓄積したレイテンシ標本から指数加重平均を一括再計算する"""
+        valid = min(self._lat_idx, 1024)
+        if valid == 0:
+            return
+        alpha = 0.1
+        # 新しい標本ほど重くする指数減衰ウェイト
+        weights = (1 - alpha) ** np.arange(valid, dtype=np.float32)[::-1]
+        samples = self._lat_buf[:valid]
+        self.sync_metrics.sync_latency_ms = float(
+            (weights * samples).sum() / weights.sum()
+        )
+
     async def _enhance_sync_mechanism(self):
         """同期メカニズム強化"""
-        try:
-            # 同期プロトコル最適化
-            sync_protocol = {
-                'version': '2.0',
-                'compression': True,
-                'encryption': False,  # 内部通信のため無効
-                'timeout': 5000,
-                'retry_count': 3
-            }
-            
-            logger.info("同期メカニズム強化完了")
-            
-        except Exception as e:
-            logger.error(f"同期メカニズム強化エラー: {e}")
+        # 同期プロトコル最適化
+        sync_protocol = {
+            'version': '2.0',
+            'compression': True,
+            'encryption': False,  # 内部通信のため無効
+            'timeout': 5000,
+            'retry_count': 3
+        }
+        
+        logger.info("同期メカニズム強化完了")
     
     async def _ensure_data_consistency(self):
         """データ整合性確保"""
-        try:
-            # データ整合性チェック
-            consistency_checks = [
-                'timestamp_consistency',
-                'data_completeness',
-                'reference_integrity',
-                'duplicate_detection'
-            ]
-            
-            passed_checks = len(consistency_checks)
-            self.sync_metrics['data_consistency_score'] = passed_checks / len(consistency_checks)
-            
-            logger.info(f"データ整合性確保完了: {self.sync_metrics['data_consistency_score']:.2%}")
-            
-        except Exception as e:
-            logger.error(f"データ整合性確保エラー: {e}")
+        # データ整合性チェック（項目はクラス定数、現状の合格率は定数1.0）
+        self.sync_metrics.data_consistency_score = 1.0
+
+        logger.info("データ整合性確保完了: %.2f%%", (self.sync_metrics.data_consistency_score) * 100)
     
     async def _enhance_error_handling(self):
         """エラー処理強化"""
-        try:
-            # エラー回復メカニズム
-            error_recovery = {
-                'retry_strategy': 'exponential_backoff',
-                'max_retries': 3,
-                'circuit_breaker': True,
-                'fallback_enabled': True
-            }
-            
-            logger.info("エラー処理強化完了")
-            
-        except Exception as e:
-            logger.error(f"エラー処理強化エラー: {e}")
+        # エラー回復メカニズム
+        error_recovery = {
+            'retry_strategy': 'exponential_backoff',
+            'max_retries': 3,
+            'circuit_breaker': True,
+            'fallback_enabled': True
+        }
+        
+        logger.info("エラー処理強化完了")
     
     def start_sync_workers(self):
         """同期ワーカー開始"""
         self.running = True
         logger.info("同期ワーカー開始")
     
-    def stop_sync_workers(self):
-        """同期ワーカー停止"""
+    async def stop_sync_workers(self):
+        """同期ワーカー停止（番兵投入後に全ワーカーの完了を待機）"""
         self.running = False
-        for worker in self.sync_workers:
-            worker.cancel()
+        for _ in self.sync_workers:
+            self.sync_queue.put_nowait(None)
+        await asyncio.gather(*self.sync_workers, return_exceptions=True)
+        self.sync_workers = []
+        self._flush_latency_metrics()
         logger.info("同期ワーカー停止")
 
+def _shard_worker_main(task_queue: 'multiprocessing.Queue', workers_per_process: int):
+    """シャードプロセス本体
+
+    子プロセス内で専用のasyncioループを立ち上げ、ParallelDataSyncEnhancer
+    のワーカー群を駆動する。親からのタスクはプロセス間キューで受け取り、
+    None番兵で停止する。
+    """
+    enhancer = ParallelDataSyncEnhancer()
+    enhancer.start_sync_workers()
+
+    async def _run():
+        await enhancer._optimize_parallel_processing(workers_per_process)
+        loop = asyncio.get_running_loop()
+        while True:
+            # プロセス間キューのブロッキングgetはスレッドに逃がす
+            task = await loop.run_in_executor(None, task_queue.get)
+            if task is None:
+                await enhancer.stop_sync_workers()
+                break
+            await enhancer.sync_queue.put(task)
+
+    asyncio.run(_run())
+
+class ShardedSyncPool:
+    """プロセスシャード型の同期プール
+
+    単一イベントループでは1件のCPU重タスク（大型ペイロードのJSONパース等）
+    が残り全ワーカーをGILで巻き込む。ワーカーをNプロセスに分割し、タスクを
+    銘柄ハッシュで一貫ルーティングすることで、CPU+IO混在ワークロードでも
+    他シャードが処理を継続でき、銘柄単位のキャッシュ局所性も1プロセス内に
+    保たれる。
+    """
+
+    def __init__(self, num_processes: int = 4, workers_per_process: int = 13):
+        self.num_processes = num_processes
+        self.workers_per_process = workers_per_process
+        self._queues: List['multiprocessing.Queue'] = []
+        self._processes: List['multiprocessing.Process'] = []
+
+    def start(self):
+        """シャードプロセス起動"""
+        for _ in range(self.num_processes):
+            task_queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_shard_worker_main,
+                args=(task_queue, self.workers_per_process),
+                daemon=True
+            )
+            process.start()
+            self._queues.append(task_queue)
+            self._processes.append(process)
+        logger.info("ShardedSyncPool開始: %sプロセス x %sワーカー",
+                    self.num_processes, self.workers_per_process)
+
+    def submit(self, task: Dict[str, Any]):
+        """タスク投入（同一銘柄は常に同じシャードへ）"""
+        shard = hash(str(task.get('symbol', ''))) % self.num_processes
+        self._queues[shard].put(task)
+
+    def stop(self):
+        """全シャードへ番兵を送り停止を待つ"""
+        for task_queue in self._queues:
+            task_queue.put(None)
+        for process in self._processes:
+            process.join(timeout=5)
+        self._queues = []
+        self._processes = []
+        logger.info("ShardedSyncPool停止")
+
 class KabuApiStabilizer:
     """kabu API 88.9%の更なる安定化"""
-    
-    def __init__(self):
+
+    # 価格キャッシュ: 800銘柄ユニバース全体を保持、鮮度許容は
+    # _optimize_latency のキャッシュ設定（ttl=60秒）に合わせる
+    _PRICE_CACHE_SIZE = 800
+    _PRICE_CACHE_TTL = 60.0
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.session = session
         self.current_success_rate = 88.9
         self.target_success_rate = 95.0
-        self.stabilization_metrics = {
-            'requests_processed': 0,
-            'success_count': 0,
-            'error_count': 0,
-            'avg_response_time': 0,
-            'stability_score': 0.0
-        }
-        
+        self.stabilization_metrics = StabilizationMetrics()
+        # 接続プール実体化: pool_size(20) + max_overflow(30) に合わせて同時実行を制限
+        self._conn_sem = asyncio.Semaphore(50)
+        # 一様乱数のプリフェッチバッファ（呼び出し毎のMT19937ドローを回避）
+        self._rand_buf = _rng.random(4096).astype(np.float32)
+        self._rand_idx = 0
+        # TTL付きLRU価格キャッシュ（(取得時刻, レスポンス) を銘柄キーで保持）
+        self._price_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+
         logger.info("KabuApiStabilizer初期化完了")
     
     async def stabilize_kabu_api(self) -> Dict[str, Any]:
         """kabu API安定化"""
-        logger.info(f"=== kabu API安定化開始: {self.current_success_rate}% → {self.target_success_rate}% ===")
+        logger.info("=== kabu API安定化開始: %s%% → %s%% ===", self.current_success_rate, self.target_success_rate)
         
         # 1. 接続安定性向上
         await self._improve_connection_stability()
@@ -427,8 +654,8 @@ class KabuApiStabilizer:
             'rate_limiting_optimized': True,
             'recovery_mechanism_enhanced': True,
             'monitoring_enhanced': True,
-            'success_rate_improved': self.stabilization_metrics['success_count'] / max(1, self.stabilization_metrics['requests_processed']) * 100,
-            'metrics': self.stabilization_metrics
+            'success_rate_improved': self.stabilization_metrics.success_count / max(1, self.stabilization_metrics.requests_processed) * 100,
+            'metrics': asdict(self.stabilization_metrics)
         }
         
         logger.info("=== kabu API安定化完了 ===")
@@ -436,202 +663,237 @@ class KabuApiStabilizer:
     
     async def _improve_connection_stability(self):
         """接続安定性向上"""
-        try:
-            # 接続プール最適化
-            connection_config = {
-                'pool_size': 20,
-                'max_overflow': 30,
-                'pool_timeout': 30,
-                'pool_recycle': 3600,
-                'pool_pre_ping': True
-            }
-            
-            # Keep-alive設定
-            keepalive_config = {
-                'enabled': True,
-                'idle_timeout': 600,
-                'interval': 30,
-                'count': 3
-            }
-            
-            self.stabilization_metrics['stability_score'] += 0.2
-            logger.info("接続安定性向上完了")
-            
-        except Exception as e:
-            logger.error(f"接続安定性向上エラー: {e}")
+        # 接続プール最適化
+        connection_config = {
+            'pool_size': 20,
+            'max_overflow': 30,
+            'pool_timeout': 30,
+            'pool_recycle': 3600,
+            'pool_pre_ping': True
+        }
+        
+        # Keep-alive設定
+        keepalive_config = {
+            'enabled': True,
+            'idle_timeout': 600,
+            'interval': 30,
+            'count': 3
+        }
+        
+        self.stabilization_metrics.stability_score += 0.2
+        logger.info("接続安定性向上完了")
     
     async def _enhance_error_handling(self):
-        """エラー処理強化"""
-        try:
-            # エラー分類と対応
-            error_handlers = {
-                'timeout': self._handle_timeout_error,
-                'connection_error': self._handle_connection_error,
-                'rate_limit': self._handle_rate_limit_error,
-                'server_error': self._handle_server_error,
-                'authentication': self._handle_auth_error
-            }
-            
-            # 自動回復機能
-            auto_recovery = {
-                'enabled': True,
-                'max_attempts': 5,
-                'backoff_factor': 2.0,
-                'jitter': True
-            }
-            
-            self.stabilization_metrics['stability_score'] += 0.2
-            logger.info("エラー処理強化完了")
-            
-        except Exception as e:
-            logger.error(f"エラー処理強化エラー: {e}")
+        """エラー処理強化（ディスパッチテーブルはクラス定数 _ERROR_HANDLERS）"""
+        # 自動回復機能
+        auto_recovery = {
+            'enabled': True,
+            'max_attempts': 5,
+            'backoff_factor': 2.0,
+            'jitter': True
+        }
+        
+        self.stabilization_metrics.stability_score += 0.2
+        logger.info("エラー処理強化完了")
     
     async def _handle_timeout_error(self, error: Exception):
         """タイムアウトエラー処理"""
-        logger.warning(f"タイムアウトエラー処理: {error}")
+        logger.warning("タイムアウトエラー処理: %s", error)
         await asyncio.sleep(1)
         return True
     
     async def _handle_connection_error(self, error: Exception):
         """接続エラー処理"""
-        logger.warning(f"接続エラー処理: {error}")
+        logger.warning("接続エラー処理: %s", error)
         await asyncio.sleep(2)
         return True
     
     async def _handle_rate_limit_error(self, error: Exception):
         """レート制限エラー処理"""
-        logger.warning(f"レート制限エラー処理: {error}")
+        logger.warning("レート制限エラー処理: %s", error)
         await asyncio.sleep(5)
         return True
     
     async def _handle_server_error(self, error: Exception):
         """サーバーエラー処理"""
-        logger.warning(f"サーバーエラー処理: {error}")
+        logger.warning("サーバーエラー処理: %s", error)
         await asyncio.sleep(3)
         return True
     
     async def _handle_auth_error(self, error: Exception):
         """認証エラー処理"""
-        logger.warning(f"認証エラー処理: {error}")
+        logger.warning("認証エラー処理: %s", error)
         await asyncio.sleep(10)
         return True
-    
+
+    # 例外型 → 回復ハンドラのディスパッチテーブル（クラスロード時に1度だけ構築）。
+    # 文字列キーと実例外型の不一致を型レベルで防ぎ、ルックアップは
+    # type(err)のO(1)照合のみ。レート制限(429)・認証(401)はHTTPステータス
+    # でしか区別できないため _handle_server_error 内で分岐する前提
+    _ERROR_HANDLERS: Dict[type, Any] = {
+        asyncio.TimeoutError: _handle_timeout_error,
+        aiohttp.ClientConnectorError: _handle_connection_error,
+        ConnectionResetError: _handle_connection_error,
+        aiohttp.ClientResponseError: _handle_server_error,
+    }
+
+    async def _dispatch_error(self, error: Exception) -> bool:
+        """例外型に応じた回復ハンドラへディスパッチする
+
+        Returns:
+            回復処理を実行した場合True、未分類の例外はFalse
+        """
+        handler = type(self)._ERROR_HANDLERS.get(type(error))
+        if handler is None:
+            logger.warning("未分類エラー: %s: %s", type(error).__name__, error)
+            return False
+        return await handler(self, error)
+
+
     async def _optimize_rate_limiting(self):
         """レート制限最適化"""
-        try:
-            # レート制限設定
-            rate_limit_config = {
-                'requests_per_second': 10,
-                'burst_size': 20,
-                'backoff_strategy': 'exponential',
-                'adaptive_rate_limiting': True
-            }
-            
-            # 適応的レート制御
-            adaptive_control = {
-                'enabled': True,
-                'success_rate_threshold': 0.95,
-                'adjustment_factor': 0.1,
-                'min_rate': 1,
-                'max_rate': 50
-            }
-            
-            self.stabilization_metrics['stability_score'] += 0.2
-            logger.info("レート制限最適化完了")
-            
-        except Exception as e:
-            logger.error(f"レート制限最適化エラー: {e}")
+        # レート制限設定
+        rate_limit_config = {
+            'requests_per_second': 10,
+            'burst_size': 20,
+            'backoff_strategy': 'exponential',
+            'adaptive_rate_limiting': True
+        }
+        
+        # 適応的レート制御
+        adaptive_control = {
+            'enabled': True,
+            'success_rate_threshold': 0.95,
+            'adjustment_factor': 0.1,
+            'min_rate': 1,
+            'max_rate': 50
+        }
+        
+        self.stabilization_metrics.stability_score += 0.2
+        logger.info("レート制限最適化完了")
     
     async def _enhance_recovery_mechanism(self):
         """回復メカニズム強化"""
-        try:
-            # 回復戦略
-            recovery_strategies = {
-                'circuit_breaker': True,
-                'bulkhead': True,
-                'timeout': True,
-                'retry': True,
-                'fallback': True
-            }
-            
-            # ヘルスチェック
-            health_check = {
-                'enabled': True,
-                'interval': 30,
-                'timeout': 5,
-                'failure_threshold': 3,
-                'recovery_threshold': 2
-            }
-            
-            self.stabilization_metrics['stability_score'] += 0.2
-            logger.info("回復メカニズム強化完了")
-            
-        except Exception as e:
-            logger.error(f"回復メカニズム強化エラー: {e}")
+        # 回復戦略
+        recovery_strategies = {
+            'circuit_breaker': True,
+            'bulkhead': True,
+            'timeout': True,
+            'retry': True,
+            'fallback': True
+        }
+        
+        # ヘルスチェック
+        health_check = {
+            'enabled': True,
+            'interval': 30,
+            'timeout': 5,
+            'failure_threshold': 3,
+            'recovery_threshold': 2
+        }
+        
+        self.stabilization_metrics.stability_score += 0.2
+        logger.info("回復メカニズム強化完了")
     
     async def _enhance_monitoring(self):
         """モニタリング強化"""
-        try:
-            # メトリクス収集
-            metrics_config = {
-                'response_time': True,
-                'error_rate': True,
-                'throughput': True,
-                'success_rate': True,
-                'connection_health': True
-            }
-            
-            # アラート設定
-            alert_config = {
-                'success_rate_threshold': 0.90,
-                'response_time_threshold': 1000,
-                'error_rate_threshold': 0.10,
-                'alert_cooldown': 300
-            }
-            
-            self.stabilization_metrics['stability_score'] += 0.2
-            logger.info("モニタリング強化完了")
-            
-        except Exception as e:
-            logger.error(f"モニタリング強化エラー: {e}")
+        # メトリクス収集
+        metrics_config = {
+            'response_time': True,
+            'error_rate': True,
+            'throughput': True,
+            'success_rate': True,
+            'connection_health': True
+        }
+        
+        # アラート設定
+        alert_config = {
+            'success_rate_threshold': 0.90,
+            'response_time_threshold': 1000,
+            'error_rate_threshold': 0.10,
+            'alert_cooldown': 300
+        }
+        
+        self.stabilization_metrics.stability_score += 0.2
+        logger.info("モニタリング強化完了")
     
+    def _evict_price_cache_tail(self):
+        """容量超過時、最もアクセスの古い1割をまとめて追い出す"""
+        for _ in range(max(1, self._PRICE_CACHE_SIZE // 10)):
+            if not self._price_cache:
+                break
+            self._price_cache.popitem(last=False)
+
     async def simulate_improved_api_call(self, symbol: str) -> Dict[str, Any]:
-        """改善されたAPI呼び出しシミュレート"""
-        self.stabilization_metrics['requests_processed'] += 1
-        
-        # 95%の成功率をシミュレート
-        import random
-        if random.random() < 0.95:
-            self.stabilization_metrics['success_count'] += 1
-            return {
-                'symbol': symbol,
-                'price': 2500.0,
-                'volume': 1000000,
-                'timestamp': datetime.now().isoformat(),
-                'source': 'kabu_api_stabilized'
-            }
-        else:
-            self.stabilization_metrics['error_count'] += 1
-            return None
+        """改善されたAPI呼び出しシミュレート（TTL付きLRUキャッシュ + 接続プール上限でゲート）"""
+        # TTL内のキャッシュヒットはAPI往復もセマフォ取得も不要
+        cached = self._price_cache.get(symbol)
+        if cached is not None and time.time() - cached[0] < self._PRICE_CACHE_TTL:
+            self._price_cache.move_to_end(symbol)
+            self.stabilization_metrics.cache_hits += 1
+            return cached[1]
+
+        wait_start = time.time()
+        async with self._conn_sem:
+            self.stabilization_metrics.semaphore_waits_ms += (time.time() - wait_start) * 1000
+            self.stabilization_metrics.requests_processed += 1
+
+            # 95%の成功率をシミュレート（バッファから1標本消費、枯渇時に補充）
+            if self._rand_idx >= len(self._rand_buf):
+                self._rand_buf = _rng.random(4096).astype(np.float32)
+                self._rand_idx = 0
+            r = self._rand_buf[self._rand_idx]
+            self._rand_idx += 1
+            if r < 0.95:
+                self.stabilization_metrics.success_count += 1
+                result = {
+                    'symbol': symbol,
+                    'price': 2500.0,
+                    'volume': 1000000,
+                    'timestamp': datetime.now().isoformat(),
+                    'source': 'kabu_api_stabilized'
+                }
+                self._price_cache[symbol] = (time.time(), result)
+                if len(self._price_cache) > self._PRICE_CACHE_SIZE:
+                    self._evict_price_cache_tail()
+                return result
+            else:
+                self.stabilization_metrics.error_count += 1
+                return None
+
+# 800銘柄ユニバースのティア構成（ティア名, 銘柄数, 優先度）。
+# 実行時に変化しない純定数のため、合計銘柄数もインポート時に畳み込む
+_TIER_SPECS: Final[Tuple[Tuple[str, int, str], ...]] = (
+    ('tier1', 168, 'high'),
+    ('tier2', 200, 'medium'),
+    ('tier3', 232, 'medium'),
+    ('tier4', 200, 'low')
+)
+_TOTAL_SYMBOLS: Final[int] = sum(spec[1] for spec in _TIER_SPECS)
 
 class UniverseSystemIntegrator:
     """800銘柄ユニバースの統合システム連携強化"""
-    
-    def __init__(self):
+
+    # 整合性チェック項目（現状は全項目が定義のみ=常時合格。実チェック実装時は
+    # passed/len で再計算すること）
+    _CONSISTENCY_CHECK_NAMES: Tuple[str, ...] = (
+        'symbol_uniqueness',
+        'data_completeness',
+        'timestamp_consistency',
+        'reference_integrity',
+        'tier_classification'
+    )
+
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        self.session = session
         self.universe_size = 800
-        self.integration_metrics = {
-            'symbols_integrated': 0,
-            'sync_success_rate': 0.0,
-            'data_consistency': 0.0,
-            'update_frequency': 0.0,
-            'integration_health': 0.0
-        }
+        self.integration_metrics = UniverseIntegrationMetrics()
         
         logger.info("UniverseSystemIntegrator初期化完了")
     
     async def integrate_universe_system(self) -> Dict[str, Any]:
         """ユニバースシステム統合"""
-        logger.info(f"=== 800銘柄ユニバースシステム統合開始 ===")
+        logger.info("=== 800銘柄ユニバースシステム統合開始 ===")
         
         # 1. ユニバース統合
         await self._integrate_universe()
@@ -650,104 +912,132 @@ class UniverseSystemIntegrator:
             'data_sync_enhanced': True,
             'consistency_ensured': True,
             'performance_optimized': True,
-            'metrics': self.integration_metrics
+            'metrics': asdict(self.integration_metrics)
         }
         
         logger.info("=== 800銘柄ユニバースシステム統合完了 ===")
         return integration_result
     
     async def _integrate_universe(self):
-        """ユニバース統合"""
-        try:
-            # ティア別統合
-            tier_integration = {
-                'tier1': {'symbols': 168, 'priority': 'high'},
-                'tier2': {'symbols': 200, 'priority': 'medium'},
-                'tier3': {'symbols': 232, 'priority': 'medium'},
-                'tier4': {'symbols': 200, 'priority': 'low'}
-            }
-            
-            total_symbols = sum(tier['symbols'] for tier in tier_integration.values())
-            self.integration_metrics['symbols_integrated'] = total_symbols
-            
-            logger.info(f"ユニバース統合完了: {total_symbols}銘柄")
-            
-        except Exception as e:
-            logger.error(f"ユニバース統合エラー: {e}")
+        """ユニバース統合（ティア構成はモジュール定数 _TIER_SPECS）"""
+        self.integration_metrics.symbols_integrated = _TOTAL_SYMBOLS
+
+        logger.info("ユニバース統合完了: %s銘柄", _TOTAL_SYMBOLS)
     
     async def _enhance_data_sync(self):
         """データ同期強化"""
-        try:
-            # 同期設定
-            sync_config = {
-                'frequency': 1,  # 1秒間隔
-                'batch_size': 100,
-                'parallel_workers': 10,
-                'timeout': 30,
-                'retry_count': 3
-            }
-            
-            # 同期成功率シミュレート
-            self.integration_metrics['sync_success_rate'] = 0.98
-            
-            logger.info("データ同期強化完了")
-            
-        except Exception as e:
-            logger.error(f"データ同期強化エラー: {e}")
+        # 同期設定
+        sync_config = {
+            'frequency': 1,  # 1秒間隔
+            'batch_size': 100,
+            'parallel_workers': 10,
+            'timeout': 30,
+            'retry_count': 3
+        }
+        
+        # 同期成功率シミュレート
+        self.integration_metrics.sync_success_rate = 0.98
+        
+        logger.info("データ同期強化完了")
     
     async def _ensure_consistency(self):
         """整合性確保"""
-        try:
-            # 整合性チェック
-            consistency_checks = [
-                'symbol_uniqueness',
-                'data_completeness',
-                'timestamp_consistency',
-                'reference_integrity',
-                'tier_classification'
-            ]
-            
-            passed_checks = len(consistency_checks)
-            self.integration_metrics['data_consistency'] = passed_checks / len(consistency_checks)
-            
-            logger.info(f"整合性確保完了: {self.integration_metrics['data_consistency']:.2%}")
-            
-        except Exception as e:
-            logger.error(f"整合性確保エラー: {e}")
+        # 整合性チェック（項目はクラス定数、現状の合格率は定数1.0）
+        self.integration_metrics.data_consistency = 1.0
+
+        logger.info("整合性確保完了: %.2f%%", (self.integration_metrics.data_consistency) * 100)
     
     async def _optimize_performance(self):
         """パフォーマンス最適化"""
-        try:
-            # パフォーマンス設定
-            performance_config = {
-                'caching_enabled': True,
-                'compression_enabled': True,
-                'parallel_processing': True,
-                'memory_optimization': True,
-                'index_optimization': True
-            }
-            
-            # メトリクス更新
-            self.integration_metrics['update_frequency'] = 1.0  # 1秒間隔
-            self.integration_metrics['integration_health'] = 0.95
-            
-            logger.info("パフォーマンス最適化完了")
-            
-        except Exception as e:
-            logger.error(f"パフォーマンス最適化エラー: {e}")
+        # パフォーマンス設定
+        performance_config = {
+            'caching_enabled': True,
+            'compression_enabled': True,
+            'parallel_processing': True,
+            'memory_optimization': True,
+            'index_optimization': True
+        }
+        
+        # メトリクス更新
+        self.integration_metrics.update_frequency = 1.0  # 1秒間隔
+        self.integration_metrics.integration_health = 0.95
+        
+        logger.info("パフォーマンス最適化完了")
+
+# ゲートEnum → スコア配列インデックス
+_GATE_INDEX: Final[Dict[QualityGate, int]] = {gate: i for i, gate in enumerate(QualityGate)}
+
+def _gate_fixture(names: Tuple[str, ...], scores: List[float]) -> Tuple[Tuple[str, ...], np.ndarray, float]:
+    """ゲートフィクスチャ構築（平均スコアはインポート時に1度だけ畳み込む）"""
+    arr = np.array(scores)
+    return names, arr, float(arr.mean())
+
+def _safe_gate(gate: QualityGate):
+    """ゲート本体の同一try/exceptを1箇所へ集約するデコレータ
+
+    6つの_execute_*_gateが持っていた同型の例外処理を1つの
+    ラッパーフレームにまとめ、各メソッドのバイトコードから
+    例外テーブルを取り除く。失敗時は不合格のQualityGateResultを返す。
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, ts: int) -> QualityGateResult:
+            try:
+                return fn(self, ts)
+            except Exception as e:
+                logger.error("%sゲートエラー: %s", gate.value, e)
+                # 合否は_scoresベクトルから導出されるため、前回実行の
+                # スコアが残ったままだと例外ゲートが合格扱いになる
+                self._scores[_GATE_INDEX[gate]] = 0.0
+                return QualityGateResult(gate, False, 0.0, {}, ts, [str(e)])
+        return wrapper
+    return decorator
 
 class IntegratedQualityGateSystem:
     """統合品質ゲートシステム"""
-    
+
+    # ゲート別スコアフィクスチャ（項目名タプル, NumPy配列, 平均値）。
+    # 値は定数のため平均スコアもクラスロード時に畳み込み済み。
+    _GATE_FIXTURES: Dict[QualityGate, Tuple[Tuple[str, ...], np.ndarray, float]] = {
+        QualityGate.DATA_QUALITY: _gate_fixture(
+            ('data_completeness', 'data_accuracy', 'data_consistency',
+             'data_timeliness', 'data_validity'),
+            [0.98, 0.96, 0.97, 0.95, 0.99]
+        ),
+        QualityGate.INTEGRATION_TEST: _gate_fixture(
+            ('data_provider_integration', 'api_integration', 'database_integration',
+             'external_service_integration', 'cross_system_integration'),
+            [0.96, 0.95, 0.97, 0.94, 0.98]
+        ),
+        QualityGate.PERFORMANCE_TEST: _gate_fixture(
+            ('response_time', 'throughput', 'scalability',
+             'resource_usage', 'concurrency'),
+            [0.97, 0.96, 0.95, 0.94, 0.98]
+        ),
+        QualityGate.SECURITY_TEST: _gate_fixture(
+            ('authentication', 'authorization', 'data_encryption',
+             'input_validation', 'vulnerability_scan'),
+            [0.98, 0.97, 0.96, 0.95, 0.99]
+        ),
+        QualityGate.RELIABILITY_TEST: _gate_fixture(
+            ('uptime', 'error_rate', 'recovery_time',
+             'fault_tolerance', 'data_integrity'),
+            [0.99, 0.98, 0.96, 0.97, 0.99]
+        ),
+        QualityGate.SCALABILITY_TEST: _gate_fixture(
+            ('load_scalability', 'data_scalability', 'user_scalability',
+             'geographic_scalability', 'functional_scalability'),
+            [0.96, 0.97, 0.95, 0.94, 0.98]
+        )
+    }
+
     def __init__(self):
-        self.quality_gates = {
-            QualityGate.DATA_QUALITY: QualityGateResult(QualityGate.DATA_QUALITY, False, 0.0, {}, datetime.now(), []),
-            QualityGate.INTEGRATION_TEST: QualityGateResult(QualityGate.INTEGRATION_TEST, False, 0.0, {}, datetime.now(), []),
-            QualityGate.PERFORMANCE_TEST: QualityGateResult(QualityGate.PERFORMANCE_TEST, False, 0.0, {}, datetime.now(), []),
-            QualityGate.SECURITY_TEST: QualityGateResult(QualityGate.SECURITY_TEST, False, 0.0, {}, datetime.now(), []),
-            QualityGate.RELIABILITY_TEST: QualityGateResult(QualityGate.RELIABILITY_TEST, False, 0.0, {}, datetime.now(), []),
-            QualityGate.SCALABILITY_TEST: QualityGateResult(QualityGate.SCALABILITY_TEST, False, 0.0, {}, datetime.now(), [])
+        # 結果は初回実行時に実体化する（プレースホルダ6個分の生成を省く）
+        self.quality_gates: Dict[QualityGate, Optional[QualityGateResult]] = {
+            gate: None for gate in QualityGate
         }
+        # ゲートスコアのSoAビュー（合否集計をベクトル化比較で行う）
+        self._scores = np.zeros(len(QualityGate), dtype=np.float64)
         
         logger.info("IntegratedQualityGateSystem初期化完了")
     
@@ -755,22 +1045,24 @@ class IntegratedQualityGateSystem:
         """全品質ゲート実行"""
         logger.info("=== 統合品質ゲート実行開始 ===")
         
-        # 並列で全品質ゲートを実行
-        gate_tasks = [
-            self._execute_data_quality_gate(),
-            self._execute_integration_test_gate(),
-            self._execute_performance_test_gate(),
-            self._execute_security_test_gate(),
-            self._execute_reliability_test_gate(),
-            self._execute_scalability_test_gate()
+        # 各ゲートはawaitを含まないCPU処理のみのため同期実行する
+        # （Task生成とgatherのスケジューリングコストを省く。IO化した時点で並列化に戻す）
+        # タイムスタンプは1回の実行につき1度だけmonotonic tickで取得して共有する
+        ts = time.monotonic_ns()
+        results = [
+            self._execute_data_quality_gate(ts),
+            self._execute_integration_test_gate(ts),
+            self._execute_performance_test_gate(ts),
+            self._execute_security_test_gate(ts),
+            self._execute_reliability_test_gate(ts),
+            self._execute_scalability_test_gate(ts)
         ]
-        
-        results = await asyncio.gather(*gate_tasks, return_exceptions=True)
-        
-        # 結果集約
-        passed_gates = sum(1 for result in results if isinstance(result, QualityGateResult) and result.passed)
+
+        # 結果集約（スコア配列に対する1回のベクトル化比較）
+        passed_flags = self._scores >= 0.95
+        passed_gates = int(passed_flags.sum())
         total_gates = len(results)
-        overall_pass_rate = passed_gates / total_gates
+        overall_pass_rate = float(passed_flags.mean())
         
         gate_summary = {
             'total_gates': total_gates,
@@ -778,203 +1070,185 @@ class IntegratedQualityGateSystem:
             'failed_gates': total_gates - passed_gates,
             'overall_pass_rate': overall_pass_rate,
             'all_gates_passed': passed_gates == total_gates,
-            'gate_results': {gate.name: result for gate, result in zip(self.quality_gates.keys(), results) if isinstance(result, QualityGateResult)}
+            'gate_results': {result.gate.name: result for result in results}
         }
         
-        logger.info(f"=== 統合品質ゲート実行完了: {passed_gates}/{total_gates} 合格 ===")
+        logger.info("=== 統合品質ゲート実行完了: %s/%s 合格 ===", passed_gates, total_gates)
         return gate_summary
     
-    async def _execute_data_quality_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.DATA_QUALITY)
+    def _execute_data_quality_gate(self, ts: int) -> QualityGateResult:
         """データ品質ゲート実行"""
-        try:
-            # データ品質チェック
-            quality_checks = {
-                'data_completeness': 0.98,
-                'data_accuracy': 0.96,
-                'data_consistency': 0.97,
-                'data_timeliness': 0.95,
-                'data_validity': 0.99
-            }
-            
-            average_score = sum(quality_checks.values()) / len(quality_checks)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.DATA_QUALITY,
-                passed=passed,
-                score=average_score,
-                details=quality_checks,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['データ品質基準の改善が必要']
-            )
-            
-            self.quality_gates[QualityGate.DATA_QUALITY] = result
-            logger.info(f"データ品質ゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"データ品質ゲートエラー: {e}")
-            return QualityGateResult(QualityGate.DATA_QUALITY, False, 0.0, {}, datetime.now(), [str(e)])
+        # データ品質チェック
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.DATA_QUALITY]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.DATA_QUALITY,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['データ品質基準の改善が必要']
+        )
+        
+        self.quality_gates[QualityGate.DATA_QUALITY] = result
+        self._scores[_GATE_INDEX[QualityGate.DATA_QUALITY]] = average_score
+        logger.info("データ品質ゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
     
-    async def _execute_integration_test_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.INTEGRATION_TEST)
+    def _execute_integration_test_gate(self, ts: int) -> QualityGateResult:
         """統合テストゲート実行"""
-        try:
-            # 統合テスト結果
-            integration_tests = {
-                'data_provider_integration': 0.96,
-                'api_integration': 0.95,
-                'database_integration': 0.97,
-                'external_service_integration': 0.94,
-                'cross_system_integration': 0.98
-            }
-            
-            average_score = sum(integration_tests.values()) / len(integration_tests)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.INTEGRATION_TEST,
-                passed=passed,
-                score=average_score,
-                details=integration_tests,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['統合テストの改善が必要']
-            )
-            
-            self.quality_gates[QualityGate.INTEGRATION_TEST] = result
-            logger.info(f"統合テストゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"統合テストゲートエラー: {e}")
-            return QualityGateResult(QualityGate.INTEGRATION_TEST, False, 0.0, {}, datetime.now(), [str(e)])
+        # 統合テスト結果
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.INTEGRATION_TEST]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.INTEGRATION_TEST,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['統合テストの改善が必要']
+        )
+        
+        self.quality_gates[QualityGate.INTEGRATION_TEST] = result
+        self._scores[_GATE_INDEX[QualityGate.INTEGRATION_TEST]] = average_score
+        logger.info("統合テストゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
     
-    async def _execute_performance_test_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.PERFORMANCE_TEST)
+    def _execute_performance_test_gate(self, ts: int) -> QualityGateResult:
         """パフォーマンステストゲート実行"""
-        try:
-            # パフォーマンステスト結果
-            performance_tests = {
-                'response_time': 0.97,  # 応答時間
-                'throughput': 0.96,     # スループット
-                'scalability': 0.95,    # スケーラビリティ
-                'resource_usage': 0.94, # リソース使用率
-                'concurrency': 0.98     # 同時実行性
-            }
-            
-            average_score = sum(performance_tests.values()) / len(performance_tests)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.PERFORMANCE_TEST,
-                passed=passed,
-                score=average_score,
-                details=performance_tests,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['パフォーマンス最適化が必要']
-            )
-            
-            self.quality_gates[QualityGate.PERFORMANCE_TEST] = result
-            logger.info(f"パフォーマンステストゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"パフォーマンステストゲートエラー: {e}")
-            return QualityGateResult(QualityGate.PERFORMANCE_TEST, False, 0.0, {}, datetime.now(), [str(e)])
+        # パフォーマンステスト結果
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.PERFORMANCE_TEST]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.PERFORMANCE_TEST,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['パフォーマンス最適化が必要']
+        )
+        
+        self.quality_gates[QualityGate.PERFORMANCE_TEST] = result
+        self._scores[_GATE_INDEX[QualityGate.PERFORMANCE_TEST]] = average_score
+        logger.info("パフォーマンステストゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
     
-    async def _execute_security_test_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.SECURITY_TEST)
+    def _execute_security_test_gate(self, ts: int) -> QualityGateResult:
         """セキュリティテストゲート実行"""
-        try:
-            # セキュリティテスト結果
-            security_tests = {
-                'authentication': 0.98,
-                'authorization': 0.97,
-                'data_encryption': 0.96,
-                'input_validation': 0.95,
-                'vulnerability_scan': 0.99
-            }
-            
-            average_score = sum(security_tests.values()) / len(security_tests)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.SECURITY_TEST,
-                passed=passed,
-                score=average_score,
-                details=security_tests,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['セキュリティ強化が必要']
-            )
-            
-            self.quality_gates[QualityGate.SECURITY_TEST] = result
-            logger.info(f"セキュリティテストゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"セキュリティテストゲートエラー: {e}")
-            return QualityGateResult(QualityGate.SECURITY_TEST, False, 0.0, {}, datetime.now(), [str(e)])
+        # セキュリティテスト結果
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.SECURITY_TEST]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.SECURITY_TEST,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['セキュリティ強化が必要']
+        )
+        
+        self.quality_gates[QualityGate.SECURITY_TEST] = result
+        self._scores[_GATE_INDEX[QualityGate.SECURITY_TEST]] = average_score
+        logger.info("セキュリティテストゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
     
-    async def _execute_reliability_test_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.RELIABILITY_TEST)
+    def _execute_reliability_test_gate(self, ts: int) -> QualityGateResult:
         """信頼性テストゲート実行"""
-        try:
-            # 信頼性テスト結果
-            reliability_tests = {
-                'uptime': 0.99,
-                'error_rate': 0.98,
-                'recovery_time': 0.96,
-                'fault_tolerance': 0.97,
-                'data_integrity': 0.99
-            }
-            
-            average_score = sum(reliability_tests.values()) / len(reliability_tests)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.RELIABILITY_TEST,
-                passed=passed,
-                score=average_score,
-                details=reliability_tests,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['信頼性向上が必要']
-            )
-            
-            self.quality_gates[QualityGate.RELIABILITY_TEST] = result
-            logger.info(f"信頼性テストゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"信頼性テストゲートエラー: {e}")
-            return QualityGateResult(QualityGate.RELIABILITY_TEST, False, 0.0, {}, datetime.now(), [str(e)])
+        # 信頼性テスト結果
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.RELIABILITY_TEST]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.RELIABILITY_TEST,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['信頼性向上が必要']
+        )
+        
+        self.quality_gates[QualityGate.RELIABILITY_TEST] = result
+        self._scores[_GATE_INDEX[QualityGate.RELIABILITY_TEST]] = average_score
+        logger.info("信頼性テストゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
     
-    async def _execute_scalability_test_gate(self) -> QualityGateResult:
+    @_safe_gate(QualityGate.SCALABILITY_TEST)
+    def _execute_scalability_test_gate(self, ts: int) -> QualityGateResult:
         """スケーラビリティテストゲート実行"""
-        try:
-            # スケーラビリティテスト結果
-            scalability_tests = {
-                'load_scalability': 0.96,
-                'data_scalability': 0.97,
-                'user_scalability': 0.95,
-                'geographic_scalability': 0.94,
-                'functional_scalability': 0.98
-            }
-            
-            average_score = sum(scalability_tests.values()) / len(scalability_tests)
-            passed = average_score >= 0.95
-            
-            result = QualityGateResult(
-                gate=QualityGate.SCALABILITY_TEST,
-                passed=passed,
-                score=average_score,
-                details=scalability_tests,
-                timestamp=datetime.now(),
-                recommendations=[] if passed else ['スケーラビリティ改善が必要']
-            )
-            
-            self.quality_gates[QualityGate.SCALABILITY_TEST] = result
-            logger.info(f"スケーラビリティテストゲート: {'合格' if passed else '不合格'} ({average_score:.2%})")
-            return result
-            
-        except Exception as e:
-            logger.error(f"スケーラビリティテストゲートエラー: {e}")
-            return QualityGateResult(QualityGate.SCALABILITY_TEST, False, 0.0, {}, datetime.now(), [str(e)])
+        # スケーラビリティテスト結果
+        names, scores, average_score = self._GATE_FIXTURES[QualityGate.SCALABILITY_TEST]
+        passed = bool(average_score >= 0.95)
+        
+        result = QualityGateResult(
+            gate=QualityGate.SCALABILITY_TEST,
+            passed=passed,
+            score=average_score,
+            details=dict(zip(names, scores.tolist())),
+            timestamp=ts,
+            recommendations=[] if passed else ['スケーラビリティ改善が必要']
+        )
+        
+        self.quality_gates[QualityGate.SCALABILITY_TEST] = result
+        self._scores[_GATE_INDEX[QualityGate.SCALABILITY_TEST]] = average_score
+        logger.info("スケーラビリティテストゲート: %s (%.2f%%)", '合格' if passed else '不合格', (average_score) * 100)
+        return result
+
+# Phase 2安全性チェックの定数フィクスチャ。値は実行時に変化しないため、
+# 各スコアもインポート時に1度だけ畳み込む
+_RISK_FACTORS: Final[Dict[str, float]] = {
+    'data_loss_risk': 0.02,
+    'system_failure_risk': 0.03,
+    'security_breach_risk': 0.01,
+    'performance_degradation_risk': 0.05,
+    'integration_failure_risk': 0.04
+}
+# リスクスコア（リスクが低いほど高スコア）
+_RISK_SCORE: Final[float] = 1.0 - max(_RISK_FACTORS.values())
+
+_SAFETY_CHECKS: Final[Dict[str, float]] = {
+    'data_backup_verification': 0.99,
+    'failover_mechanism_test': 0.98,
+    'recovery_procedure_test': 0.97,
+    'emergency_stop_test': 0.99,
+    'data_integrity_check': 0.98
+}
+_SAFETY_CHECK_SCORE: Final[float] = fmean(_SAFETY_CHECKS.values())
+
+_COMPLIANCE_ITEMS: Final[Dict[str, float]] = {
+    'data_protection_compliance': 0.99,
+    'financial_regulation_compliance': 0.98,
+    'security_standard_compliance': 0.97,
+    'operational_procedure_compliance': 0.99,
+    'audit_trail_compliance': 0.98
+}
+_COMPLIANCE_SCORE: Final[float] = fmean(_COMPLIANCE_ITEMS.values())
+
+_MONITORING_ITEMS: Final[Dict[str, float]] = {
+    'real_time_monitoring': 0.99,
+    'alert_system': 0.98,
+    'performance_monitoring': 0.97,
+    'security_monitoring': 0.99,
+    'business_monitoring': 0.96
+}
+_MONITORING_SCORE: Final[float] = fmean(_MONITORING_ITEMS.values())
+
+_INCIDENT_RESPONSE_ITEMS: Final[Dict[str, float]] = {
+    'incident_detection': 0.99,
+    'notification_system': 0.98,
+    'response_procedures': 0.97,
+    'recovery_procedures': 0.99,
+    'communication_plan': 0.96
+}
+_INCIDENT_SCORE: Final[float] = fmean(_INCIDENT_RESPONSE_ITEMS.values())
 
 class Phase2SafetySystem:
     """Phase 2安全性100%確保システム"""
@@ -994,22 +1268,21 @@ class Phase2SafetySystem:
         """Phase 2安全性確保"""
         logger.info("=== Phase 2安全性100%確保開始 ===")
         
-        # 1. リスクアセスメント
-        await self._conduct_risk_assessment()
-        
-        # 2. 安全性チェック
-        await self._conduct_safety_checks()
-        
-        # 3. コンプライアンス確認
-        await self._verify_compliance()
-        
-        # 4. 監視システム強化
-        await self._enhance_monitoring()
-        
-        # 5. インシデント対応準備
-        await self._prepare_incident_response()
-        
-        overall_safety_score = sum(self.safety_metrics.values()) / len(self.safety_metrics)
+        # 5つのサブチェックは互いに独立で、safety_metricsの別々のキーにしか
+        # 書き込まないため並行実行する（所要時間は合計でなく最遅の1本に収束）
+        check_results = await asyncio.gather(
+            self._conduct_risk_assessment(),
+            self._conduct_safety_checks(),
+            self._verify_compliance(),
+            self._enhance_monitoring(),
+            self._prepare_incident_response(),
+            return_exceptions=True
+        )
+        for check_error in check_results:
+            if isinstance(check_error, Exception):
+                logger.error("安全性サブチェックエラー: %s", check_error)
+
+        overall_safety_score = fmean(self.safety_metrics.values())
         
         safety_result = {
             'overall_safety_score': overall_safety_score,
@@ -1022,109 +1295,50 @@ class Phase2SafetySystem:
             'metrics': self.safety_metrics
         }
         
-        logger.info(f"=== Phase 2安全性確保完了: {overall_safety_score:.2%} ===")
+        logger.info("=== Phase 2安全性確保完了: %.2f%% ===", (overall_safety_score) * 100)
         return safety_result
     
     async def _conduct_risk_assessment(self):
         """リスクアセスメント実施"""
-        try:
-            # リスク評価項目
-            risk_factors = {
-                'data_loss_risk': 0.02,
-                'system_failure_risk': 0.03,
-                'security_breach_risk': 0.01,
-                'performance_degradation_risk': 0.05,
-                'integration_failure_risk': 0.04
-            }
-            
-            # リスクスコア計算（リスクが低いほど高スコア）
-            risk_score = 1.0 - max(risk_factors.values())
-            self.safety_metrics['risk_assessment'] = risk_score
-            
-            logger.info(f"リスクアセスメント完了: {risk_score:.2%}")
-            
-        except Exception as e:
-            logger.error(f"リスクアセスメントエラー: {e}")
+        self.safety_metrics['risk_assessment'] = _RISK_SCORE
+
+        logger.info("リスクアセスメント完了: %.2f%%", _RISK_SCORE * 100)
     
     async def _conduct_safety_checks(self):
         """安全性チェック実施"""
-        try:
-            # 安全性チェック項目
-            safety_checks = {
-                'data_backup_verification': 0.99,
-                'failover_mechanism_test': 0.98,
-                'recovery_procedure_test': 0.97,
-                'emergency_stop_test': 0.99,
-                'data_integrity_check': 0.98
-            }
-            
-            safety_score = sum(safety_checks.values()) / len(safety_checks)
-            self.safety_metrics['safety_score'] = safety_score
-            
-            logger.info(f"安全性チェック完了: {safety_score:.2%}")
-            
-        except Exception as e:
-            logger.error(f"安全性チェックエラー: {e}")
+        self.safety_metrics['safety_score'] = _SAFETY_CHECK_SCORE
+
+        logger.info("安全性チェック完了: %.2f%%", _SAFETY_CHECK_SCORE * 100)
     
     async def _verify_compliance(self):
         """コンプライアンス確認"""
-        try:
-            # コンプライアンス項目
-            compliance_items = {
-                'data_protection_compliance': 0.99,
-                'financial_regulation_compliance': 0.98,
-                'security_standard_compliance': 0.97,
-                'operational_procedure_compliance': 0.99,
-                'audit_trail_compliance': 0.98
-            }
-            
-            compliance_score = sum(compliance_items.values()) / len(compliance_items)
-            self.safety_metrics['compliance_score'] = compliance_score
-            
-            logger.info(f"コンプライアンス確認完了: {compliance_score:.2%}")
-            
-        except Exception as e:
-            logger.error(f"コンプライアンス確認エラー: {e}")
+        self.safety_metrics['compliance_score'] = _COMPLIANCE_SCORE
+
+        logger.info("コンプライアンス確認完了: %.2f%%", _COMPLIANCE_SCORE * 100)
     
     async def _enhance_monitoring(self):
         """監視システム強化"""
-        try:
-            # 監視項目
-            monitoring_items = {
-                'real_time_monitoring': 0.99,
-                'alert_system': 0.98,
-                'performance_monitoring': 0.97,
-                'security_monitoring': 0.99,
-                'business_monitoring': 0.96
-            }
-            
-            monitoring_score = sum(monitoring_items.values()) / len(monitoring_items)
-            self.safety_metrics['monitoring_coverage'] = monitoring_score
-            
-            logger.info(f"監視システム強化完了: {monitoring_score:.2%}")
-            
-        except Exception as e:
-            logger.error(f"監視システム強化エラー: {e}")
+        self.safety_metrics['monitoring_coverage'] = _MONITORING_SCORE
+
+        logger.info("監視システム強化完了: %.2f%%", _MONITORING_SCORE * 100)
     
     async def _prepare_incident_response(self):
         """インシデント対応準備"""
-        try:
-            # インシデント対応項目
-            incident_response_items = {
-                'incident_detection': 0.99,
-                'notification_system': 0.98,
-                'response_procedures': 0.97,
-                'recovery_procedures': 0.99,
-                'communication_plan': 0.96
-            }
-            
-            incident_score = sum(incident_response_items.values()) / len(incident_response_items)
-            self.safety_metrics['incident_response'] = incident_score
-            
-            logger.info(f"インシデント対応準備完了: {incident_score:.2%}")
-            
-        except Exception as e:
-            logger.error(f"インシデント対応準備エラー: {e}")
+        self.safety_metrics['incident_response'] = _INCIDENT_SCORE
+
+        logger.info("インシデント対応準備完了: %.2f%%", _INCIDENT_SCORE * 100)
+
+# ログ区切り線（毎回の文字列乗算を避ける事前計算定数）
+_BANNER: Final[str] = "=" * 100
+
+# 品質ゲート/Phase 2安全性の準備は実処理がないため、非同期バッチの外で
+# 組み立てた静的な完了エントリを使う
+_QUALITY_GATES_READY: Final[Dict[str, Any]] = {
+    'success': True, 'component': 'quality_gates', 'result': 'quality_gates_ready'
+}
+_PHASE2_SAFETY_READY: Final[Dict[str, Any]] = {
+    'success': True, 'component': 'phase2_safety', 'result': 'phase2_safety_ready'
+}
 
 class IntegratedSystemEmergencyUpgrade:
     """統合システム緊急アップグレード"""
@@ -1132,57 +1346,131 @@ class IntegratedSystemEmergencyUpgrade:
     def __init__(self):
         self.data_integration_optimizer = DataIntegrationOptimizer()
         self.parallel_sync_enhancer = ParallelDataSyncEnhancer()
-        self.kabu_api_stabilizer = KabuApiStabilizer()
-        self.universe_integrator = UniverseSystemIntegrator()
+        # 共有セッションをコンストラクタ注入（各コンポーネントで個別プールを作らない）
+        shared_session = self.data_integration_optimizer.session
+        self.kabu_api_stabilizer = KabuApiStabilizer(session=shared_session)
+        self.universe_integrator = UniverseSystemIntegrator(session=shared_session)
         self.quality_gate_system = IntegratedQualityGateSystem()
         self.phase2_safety_system = Phase2SafetySystem()
-        
+
+        # メトリクス履歴（SoAリングバッファ: 集計はベクトル化リダクション）
+        self.metric_history = MetricRingBuffer(capacity=1024)
+
         # 統合メトリクス
         self.integration_metrics = {
             'upgrade_start_time': datetime.now(),
             'components_upgraded': 0,
-            'total_components': 6,
+            'total_components': 4,
             'overall_success_rate': 0.0,
             'quality_gate_pass_rate': 0.0,
             'phase2_safety_score': 0.0
         }
         
         logger.info("IntegratedSystemEmergencyUpgrade初期化完了")
-    
+
+    def _record_component_metrics(self, component: SystemComponent,
+                                  success: bool, elapsed_ms: float) -> None:
+        """コンポーネントアップグレード1回分のスナップショットを履歴へ記録
+
+        未計測の項目（スループット・メモリ等）は0で埋める。集計は
+        MetricRingBufferのベクトル化リダクションに任せる。
+        """
+        self.metric_history.record(IntegrationMetrics(
+            component=component,
+            timestamp=datetime.now(),
+            success_rate=1.0 if success else 0.0,
+            response_time_ms=elapsed_ms,
+            error_count=0 if success else 1,
+            throughput=0.0,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            connection_count=0
+        ))
+
+    async def _run_upgrade_pool(self, factories: List[Any]) -> List[Dict[str, Any]]:
+        """アップグレードタスクを固定ワーカープールで実行する
+
+        コルーチンファクトリを(インデックス, ファクトリ)でキューに積み、
+        ワーカーは完了次第すぐ次のタスクを引く。結果は事前確保した
+        リストへインデックスで書き戻すため、投入順が保たれる。
+        """
+        task_queue: asyncio.Queue = asyncio.Queue()
+        for index, factory in enumerate(factories):
+            task_queue.put_nowait((index, factory))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(factories)
+
+        async def _worker():
+            while True:
+                try:
+                    index, factory = task_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[index] = await factory()
+                task_queue.task_done()
+
+        worker_count = min(len(factories), os.cpu_count() or 1)
+        await asyncio.gather(*(_worker() for _ in range(worker_count)))
+        return results
+
+    def _log_final_report(self, final_results: Dict[str, Any]) -> None:
+        """最終レポートのバナー出力（INFOが無効なら一切整形しない）"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(_BANNER)
+        logger.info("✅ 【TECH_LEAD最高レベル緊急事態対応】統合システム緊急アップグレード完了")
+        logger.info("📊 アップグレード成功率: %.2f%%", (self.integration_metrics['overall_success_rate']) * 100)
+        logger.info("🏆 品質ゲート合格率: %.2f%%", (self.integration_metrics['quality_gate_pass_rate']) * 100)
+        logger.info("🛡️ Phase 2安全性スコア: %.2f%%", (self.integration_metrics['phase2_safety_score']) * 100)
+        logger.info("⏱️ 平均コンポーネント応答: %.1fms / エラー%d件",
+                    self.integration_metrics.get('mean_component_response_ms', 0.0),
+                    self.integration_metrics.get('component_error_total', 0))
+        logger.info("🎯 全目標達成: %s", '✅' if final_results['all_targets_achieved'] else '❌')
+        logger.info(_BANNER)
+
     async def execute_maximum_emergency_upgrade(self) -> Dict[str, Any]:
         """最高レベル緊急アップグレード実行"""
-        logger.info("=" * 100)
-        logger.info("🚨 【TECH_LEAD最高レベル緊急事態対応】統合システム緊急アップグレード開始")
-        logger.info("=" * 100)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_BANNER)
+            logger.info("🚨 【TECH_LEAD最高レベル緊急事態対応】統合システム緊急アップグレード開始")
+            logger.info(_BANNER)
         
         try:
             # 1. 並列でシステムコンポーネントアップグレード
-            upgrade_tasks = [
-                self._upgrade_data_integration(),
-                self._upgrade_parallel_sync(),
-                self._upgrade_kabu_api(),
-                self._upgrade_universe_system(),
-                self._upgrade_quality_gates(),
-                self._upgrade_phase2_safety()
+            # 静的バッチ(gather)は最遅タスクに全体が律速されるため、
+            # asyncio.Queueからワーカーが次のタスクを引くワークスティーリング
+            # 方式に変更。軽いアップグレードがワーカーを遊ばせず、所要時間は
+            # 最長単一タスクに漸近する。各_upgrade_*は内部で例外を捕捉し
+            # 結果dictを返す。
+            upgrade_factories = [
+                self._upgrade_data_integration,
+                self._upgrade_parallel_sync,
+                self._upgrade_kabu_api,
+                self._upgrade_universe_system
             ]
-            
-            upgrade_results = await asyncio.gather(*upgrade_tasks, return_exceptions=True)
-            
+            upgrade_results = await self._run_upgrade_pool(upgrade_factories)
+
             # 2. 結果集約
             successful_upgrades = sum(
-                1 for result in upgrade_results 
-                if isinstance(result, dict) and result.get('success', False)
+                1 for result in upgrade_results
+                if result.get('success', False)
             )
             
             self.integration_metrics['components_upgraded'] = successful_upgrades
             self.integration_metrics['overall_success_rate'] = successful_upgrades / self.integration_metrics['total_components']
             
-            # 3. 統合品質ゲート実行
-            quality_gate_results = await self.quality_gate_system.execute_all_quality_gates()
-            self.integration_metrics['quality_gate_pass_rate'] = quality_gate_results['overall_pass_rate']
+            # 履歴バッファの集計（C実装のリダクション）を統合メトリクスへ反映
+            self.integration_metrics['mean_component_success_rate'] = self.metric_history.mean_success_rate()
+            self.integration_metrics['mean_component_response_ms'] = self.metric_history.mean_response_time_ms()
+            self.integration_metrics['component_error_total'] = self.metric_history.total_errors()
             
-            # 4. Phase 2安全性確保
-            safety_results = await self.phase2_safety_system.ensure_phase2_safety()
+            # 3-4. 統合品質ゲートとPhase 2安全性確保
+            # 両者は互いに独立なメトリクスへ書き込むため並行実行で融合する
+            quality_gate_results, safety_results = await asyncio.gather(
+                self.quality_gate_system.execute_all_quality_gates(),
+                self.phase2_safety_system.ensure_phase2_safety()
+            )
+            self.integration_metrics['quality_gate_pass_rate'] = quality_gate_results['overall_pass_rate']
             self.integration_metrics['phase2_safety_score'] = safety_results['overall_safety_score']
             
             # 5. 最終統合結果
@@ -1200,81 +1488,93 @@ class IntegratedSystemEmergencyUpgrade:
                     'parallel_sync': upgrade_results[1] if len(upgrade_results) > 1 else None,
                     'kabu_api': upgrade_results[2] if len(upgrade_results) > 2 else None,
                     'universe_system': upgrade_results[3] if len(upgrade_results) > 3 else None,
-                    'quality_gates': upgrade_results[4] if len(upgrade_results) > 4 else None,
-                    'phase2_safety': upgrade_results[5] if len(upgrade_results) > 5 else None
+                    # 品質ゲート/Phase 2安全性の「準備」は実処理のないno-opのため
+                    # タスク化せず静的エントリで完了扱いにする（Task割り当て2回削減）
+                    'quality_gates': _QUALITY_GATES_READY,
+                    'phase2_safety': _PHASE2_SAFETY_READY
                 },
                 'quality_gate_results': quality_gate_results,
                 'safety_results': safety_results,
                 'integration_metrics': self.integration_metrics
             }
             
-            logger.info("=" * 100)
-            logger.info("✅ 【TECH_LEAD最高レベル緊急事態対応】統合システム緊急アップグレード完了")
-            logger.info(f"📊 アップグレード成功率: {self.integration_metrics['overall_success_rate']:.2%}")
-            logger.info(f"🏆 品質ゲート合格率: {self.integration_metrics['quality_gate_pass_rate']:.2%}")
-            logger.info(f"🛡️ Phase 2安全性スコア: {self.integration_metrics['phase2_safety_score']:.2%}")
-            logger.info(f"🎯 全目標達成: {'✅' if final_results['all_targets_achieved'] else '❌'}")
-            logger.info("=" * 100)
+            self._log_final_report(final_results)
             
             return final_results
             
         except Exception as e:
-            logger.error(f"統合システム緊急アップグレードエラー: {e}")
-            logger.error(f"スタックトレース: {traceback.format_exc()}")
+            logger.error("統合システム緊急アップグレードエラー: %s", e)
+            logger.debug("スタックトレース", exc_info=True)
             return {
                 'emergency_upgrade_completed': False,
                 'error': str(e),
                 'integration_metrics': self.integration_metrics
             }
+        finally:
+            # 共有セッション（コネクタ込み）を明示的に閉じ、
+            # 実行終了時のunclosed session/connector警告を防ぐ
+            await self.data_integration_optimizer.close()
     
     async def _upgrade_data_integration(self) -> Dict[str, Any]:
         """データ統合アップグレード"""
+        start = time.perf_counter()
         try:
             result = await self.data_integration_optimizer.optimize_data_integration()
+            self._record_component_metrics(
+                SystemComponent.INTEGRATION_LAYER, True, (time.perf_counter() - start) * 1000
+            )
             return {'success': True, 'component': 'data_integration', 'result': result}
         except Exception as e:
+            self._record_component_metrics(
+                SystemComponent.INTEGRATION_LAYER, False, (time.perf_counter() - start) * 1000
+            )
             return {'success': False, 'component': 'data_integration', 'error': str(e)}
     
     async def _upgrade_parallel_sync(self) -> Dict[str, Any]:
         """並列同期アップグレード"""
+        start = time.perf_counter()
         try:
             result = await self.parallel_sync_enhancer.enhance_parallel_sync()
+            self._record_component_metrics(
+                SystemComponent.BATCH_FETCHER, True, (time.perf_counter() - start) * 1000
+            )
             return {'success': True, 'component': 'parallel_sync', 'result': result}
         except Exception as e:
+            self._record_component_metrics(
+                SystemComponent.BATCH_FETCHER, False, (time.perf_counter() - start) * 1000
+            )
             return {'success': False, 'component': 'parallel_sync', 'error': str(e)}
     
     async def _upgrade_kabu_api(self) -> Dict[str, Any]:
         """kabu APIアップグレード"""
+        start = time.perf_counter()
         try:
             result = await self.kabu_api_stabilizer.stabilize_kabu_api()
+            self._record_component_metrics(
+                SystemComponent.KABU_API, True, (time.perf_counter() - start) * 1000
+            )
             return {'success': True, 'component': 'kabu_api', 'result': result}
         except Exception as e:
+            self._record_component_metrics(
+                SystemComponent.KABU_API, False, (time.perf_counter() - start) * 1000
+            )
             return {'success': False, 'component': 'kabu_api', 'error': str(e)}
     
     async def _upgrade_universe_system(self) -> Dict[str, Any]:
         """ユニバースシステムアップグレード"""
+        start = time.perf_counter()
         try:
             result = await self.universe_integrator.integrate_universe_system()
+            self._record_component_metrics(
+                SystemComponent.UNIVERSE_MANAGER, True, (time.perf_counter() - start) * 1000
+            )
             return {'success': True, 'component': 'universe_system', 'result': result}
         except Exception as e:
+            self._record_component_metrics(
+                SystemComponent.UNIVERSE_MANAGER, False, (time.perf_counter() - start) * 1000
+            )
             return {'success': False, 'component': 'universe_system', 'error': str(e)}
     
-    async def _upgrade_quality_gates(self) -> Dict[str, Any]:
-        """品質ゲートアップグレード"""
-        try:
-            # 品質ゲートシステム自体の準備
-            return {'success': True, 'component': 'quality_gates', 'result': 'quality_gates_ready'}
-        except Exception as e:
-            return {'success': False, 'component': 'quality_gates', 'error': str(e)}
-    
-    async def _upgrade_phase2_safety(self) -> Dict[str, Any]:
-        """Phase 2安全性アップグレード"""
-        try:
-            # Phase 2安全性システム自体の準備
-            return {'success': True, 'component': 'phase2_safety', 'result': 'phase2_safety_ready'}
-        except Exception as e:
-            return {'success': False, 'component': 'phase2_safety', 'error': str(e)}
-
 async def main():
     """メイン実行関数"""
     logger.info("🚨 【TECH_LEAD最高レベル緊急事態対応】統合システム緊急修正開始")
@@ -1286,14 +1586,13 @@ async def main():
         # 最高レベル緊急アップグレード実行
         final_results = await upgrade_system.execute_maximum_emergency_upgrade()
         
-        # 結果をJSONで保存
+        # 結果をJSONで保存（全文字列を組み立てずエンコーダからファイルへ直接ストリーム）
         json_fixer = JsonSerializationFixer()
-        results_json = json_fixer.safe_json_dumps(final_results, indent=2)
-        
         result_file = Path("integrated_system_emergency_upgrade_result.json")
-        result_file.write_text(results_json, encoding='utf-8')
+        with result_file.open('w', encoding='utf-8') as fp:
+            json_fixer.safe_json_dump(final_results, fp, indent=2)
         
-        logger.info(f"📄 詳細結果保存: {result_file}")
+        logger.info("📄 詳細結果保存: %s", result_file)
         
         # TECH_LEADへの最終報告準備
         report_message = f"""【最高レベル緊急事態対応完了報告】
@@ -1324,13 +1623,13 @@ async def main():
 data_engineer最高レベル緊急対応完了 - PRESIDENT承認事項100%達成"""
         
         logger.info("📤 TECH_LEADへの最終報告準備完了")
-        logger.info(f"報告内容:\n{report_message}")
+        logger.info("報告内容:\n%s", report_message)
         
         return final_results
         
     except Exception as e:
-        logger.error(f"❌ 統合システム緊急アップグレードエラー: {e}")
-        logger.error(f"スタックトレース: {traceback.format_exc()}")
+        logger.error("❌ 統合システム緊急アップグレードエラー: %s", e)
+        logger.debug("スタックトレース", exc_info=True)
         return {'error': str(e)}
 
 if __name__ == "__main__":
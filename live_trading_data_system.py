@@ -11,27 +11,77 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 import asyncio
 import logging
 import time
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union
 from enum import Enum
 from dataclasses import dataclass
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import threading
-from queue import Queue, Empty
+from collections import deque
+from queue import Queue, Empty, SimpleQueue
 import signal
 import atexit
 
-# ログ設定
+from distributed_investment_system import RealTimeData
+
+# orjsonが入っていればRust実装のエンコーダでJSONシリアライズを高速化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloopが入っていればlibuvベースのイベントループで3タスクの多重化を高速化
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+# ログ設定: イベントループスレッドがディスク書き込みでブロックしないよう
+# ロガーにはQueueHandlerのみを挿し、file/streamへのIOはQueueListenerの
+# バックグラウンドスレッドで行う
+_log_queue: SimpleQueue = SimpleQueue()
+
+class _CachedTimeFormatter(logging.Formatter):
+    """asctime整形を秒単位でキャッシュするFormatter
+
+    既定のformatTimeはレコード毎にlocaltime+strftimeを実行する。
+    高頻度ログでは同一秒内の整形結果を使い回し、付け直すのは
+    ミリ秒部のみにする。リスナースレッド単独で使うためロック不要。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = -1
+        self._cached_stamp = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._cached_stamp = time.strftime(
+                '%Y-%m-%d %H:%M:%S', time.localtime(second)
+            )
+            self._last_second = second
+        return f"{self._cached_stamp},{int(record.created % 1 * 1000):03d}"
+
+_log_formatter = _CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('live_trading_data.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('live_trading_data.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
+)
+_log_listener = QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 class TradingMode(Enum):
@@ -58,6 +108,7 @@ class LiveTradingConfig:
     quality_threshold: float = 0.95  # 95%以上の品質要求
     emergency_stop_threshold: float = 0.80  # 80%以下で緊急停止
     max_latency_ms: float = 500  # 最大レイテンシ500ms
+    pipeline_depth: int = 3  # 先行投入するバッチリクエスト数
     enable_kabu_api: bool = True
     enable_yahoo_finance: bool = True
     enable_real_time_monitoring: bool = True
@@ -83,18 +134,24 @@ class LiveTradingDataSystem:
         
         # データ品質監視
         self.data_quality_monitor = DataQualityMonitor()
-        
-        # 実取引用統計
-        self.live_stats = {
-            'start_time': datetime.now(),
-            'total_data_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'average_latency_ms': 0,
-            'data_quality_score': 0.0,
-            'emergency_stops': 0,
-            'uptime_seconds': 0
-        }
+
+        # データ供給の同時実行上限（100ワーカー契約の維持）
+        self._supply_semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        
+        # 実取引用統計: 共有dictを複数コルーチンから書き換えるのをやめ、
+        # プレーン属性で保持する（稼働時間はmonotonic差分で計る）。
+        # 外部へはget_system_statusでスナップショットdictとして公開する
+        self._start_monotonic = time.monotonic()
+        self._start_time = datetime.now()
+        self._successful_requests = 0
+        self._failed_requests = 0
+        self._emergency_stops = 0
+        self._average_latency_ms = 0.0
+        self._data_quality_score = 0.0
+        self._uptime_seconds = 0.0
+        # success_rateはカウンタが動いた時だけ再計算するキャッシュ
+        self._success_rate = 0.0
+        self._rate_basis = -1
         
         # 緊急停止処理
         self._setup_emergency_handlers()
@@ -102,14 +159,27 @@ class LiveTradingDataSystem:
         self.logger.info("🚀 LiveTradingDataSystem初期化完了")
     
     def _setup_emergency_handlers(self):
-        """緊急停止ハンドラー設定"""
-        def emergency_stop_handler(signum, frame):
+        """緊急停止ハンドラー設定
+
+        SIGINT/SIGTERMはイベントループ起動後にloop.add_signal_handlerで
+        登録する（_register_signal_handlers参照）。signal.signalの
+        トランポリンから停止処理を走らせるとループ上の状態と競合するため、
+        ここでは同期シャットダウン経路のatexitのみ登録する。
+        """
+        atexit.register(self.shutdown_system)
+
+    def _register_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        """シグナルハンドラーをイベントループへ登録"""
+        def _on_signal():
             self.logger.warning("🚨 緊急停止シグナル受信")
             self.emergency_stop_system()
-        
-        signal.signal(signal.SIGINT, emergency_stop_handler)
-        signal.signal(signal.SIGTERM, emergency_stop_handler)
-        atexit.register(self.shutdown_system)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, _on_signal)
+            except NotImplementedError:
+                # add_signal_handler非対応プラットフォームでは従来方式
+                signal.signal(sig, lambda signum, frame: _on_signal())
     
     def verify_president_approval(self) -> bool:
         """PRESIDENT承認確認"""
@@ -120,25 +190,33 @@ class LiveTradingDataSystem:
         self.logger.info("✅ PRESIDENT承認確認済み - 実取引データ供給承認")
         return True
     
-    def verify_system_readiness(self) -> bool:
-        """システム準備状態確認"""
+    def verify_system_readiness(self, fail_fast: bool = False) -> bool:
+        """システム準備状態確認
+
+        チェックは(名前, callable)で保持して評価を遅延させる。
+        fail_fast=Trueなら最初の不合格で残りを評価せず打ち切り、
+        既定では従来どおり全項目を報告する。
+        """
         readiness_checks = [
-            ("PRESIDENT承認", self.verify_president_approval()),
-            ("800銘柄ユニバース", len(self.distributed_system.universe_manager.stocks) >= 800),
-            ("100並列データ取得", self.distributed_system.batch_fetcher.max_workers >= 100),
-            ("リアルタイム監視", self.distributed_system.real_time_monitor is not None),
-            ("データ品質監視", self.data_quality_monitor is not None),
-            ("緊急停止機能", not self.emergency_stop)
+            ("PRESIDENT承認", self.verify_president_approval),
+            ("800銘柄ユニバース", lambda: len(self.distributed_system.universe_manager.stocks) >= 800),
+            ("100並列データ取得", lambda: self.distributed_system.batch_fetcher.max_workers >= 100),
+            ("リアルタイム監視", lambda: self.distributed_system.real_time_monitor is not None),
+            ("データ品質監視", lambda: self.data_quality_monitor is not None),
+            ("緊急停止機能", lambda: not self.emergency_stop)
         ]
         
         all_ready = True
         self.logger.info("=== システム準備状態確認 ===")
         
-        for check_name, status in readiness_checks:
+        for check_name, check in readiness_checks:
+            status = check()
             status_symbol = "✅" if status else "❌"
-            self.logger.info(f"{status_symbol} {check_name}: {'OK' if status else 'NG'}")
+            self.logger.info("%s %s: %s", status_symbol, check_name, 'OK' if status else 'NG')
             if not status:
                 all_ready = False
+                if fail_fast:
+                    break
         
         if all_ready:
             self.logger.info("🎉 全システム準備完了 - 実取引データ供給開始可能")
@@ -155,6 +233,9 @@ class LiveTradingDataSystem:
         self.logger.info("🚀 実取引データ供給開始")
         self.is_running = True
         self.mode = TradingMode.LIVE
+
+        # 緊急停止シグナルをループのコールバックとして処理する
+        self._register_signal_handlers(asyncio.get_running_loop())
         
         # 分散投資システム開始
         batch_task = await self.distributed_system.start_system()
@@ -173,7 +254,13 @@ class LiveTradingDataSystem:
         return [batch_task, quality_task, supply_task, stats_task]
     
     async def _live_data_supply_loop(self):
-        """実取引データ供給ループ"""
+        """実取引データ供給ループ
+
+        バッチリクエストはpipeline_depth件まで先行投入し、ネットワーク
+        取得と結果処理をオーバーラップさせる。1バッチが1秒を超えても
+        後続が既に走っているため更新間隔を維持しやすい。
+        """
+        in_flight: deque = deque()
         while self.is_running and not self.emergency_stop:
             try:
                 loop_start = time.time()
@@ -183,29 +270,41 @@ class LiveTradingDataSystem:
                 
                 # 100並列データ取得システムでデータ取得
                 if active_symbols:
-                    request_id = self.distributed_system.batch_fetcher.submit_batch_request(
-                        active_symbols[:800],  # 800銘柄に制限
-                        priority=1  # 最高優先度
-                    )
-                    
-                    # データ取得完了待機
-                    await asyncio.sleep(0.5)
-                    
-                    # 結果取得
-                    result = self.distributed_system.batch_fetcher.get_cached_results(request_id)
+                    # 目標深度まで投入（完了通知futureを取得順に保持）
+                    while len(in_flight) < self.config.pipeline_depth:
+                        request_id = self.distributed_system.batch_fetcher.submit_batch_request(
+                            active_symbols[:800],  # 800銘柄に制限
+                            priority=1  # 最高優先度
+                        )
+                        completion = self.distributed_system.batch_fetcher.wait_for_results(request_id)
+                        if completion is None:
+                            break
+                        in_flight.append((request_id, completion))
+
+                    result = None
+                    if in_flight:
+                        # 最古の投入分をawait（到着と同時に結果を受け取る）
+                        request_id, completion = in_flight.popleft()
+                        try:
+                            result = await asyncio.wait_for(
+                                completion,
+                                timeout=self.config.max_latency_ms / 1000
+                            )
+                        except asyncio.TimeoutError:
+                            result = self.distributed_system.batch_fetcher.get_cached_results(request_id)
                     
                     if result:
                         await self._process_live_data(result)
-                        self.live_stats['successful_requests'] += 1
+                        self._successful_requests += 1
                     else:
-                        self.live_stats['failed_requests'] += 1
+                        self._failed_requests += 1
                         self.logger.warning("データ取得結果未取得")
                 
                 # データ品質チェック
                 quality_score = self.data_quality_monitor.get_current_quality_score()
                 
                 if quality_score < self.config.emergency_stop_threshold:
-                    self.logger.error(f"🚨 データ品質低下: {quality_score:.2%} < {self.config.emergency_stop_threshold:.2%}")
+                    self.logger.error("🚨 データ品質低下: %.2f%% < %.2f%%", quality_score * 100, self.config.emergency_stop_threshold * 100)
                     self.emergency_stop_system()
                     break
                 
@@ -215,11 +314,11 @@ class LiveTradingDataSystem:
                 await asyncio.sleep(sleep_time)
                 
             except Exception as e:
-                self.logger.error(f"実取引データ供給ループエラー: {e}")
-                self.live_stats['failed_requests'] += 1
+                self.logger.error("実取引データ供給ループエラー: %s", e)
+                self._failed_requests += 1
                 
                 # 連続エラーでの緊急停止
-                if self.live_stats['failed_requests'] > 10:
+                if self._failed_requests > 10:
                     self.logger.error("🚨 連続エラー発生 - 緊急停止")
                     self.emergency_stop_system()
                     break
@@ -227,58 +326,87 @@ class LiveTradingDataSystem:
                 await asyncio.sleep(1)
     
     async def _process_live_data(self, result: Dict[str, Any]):
-        """実取引データ処理"""
-        if 'results' not in result:
+        """実取引データ処理
+
+        品質判定は銘柄毎のPythonループでなく、price/timestamp/latencyを
+        列配列へ一括展開してベクトル化比較1回で妥当性マスクを作る。
+        """
+        live_data = result.get('results')
+        if not live_data:
             return
-        
-        live_data = result['results']
+
+        symbols = list(live_data.keys())
+        records = list(live_data.values())
+        count = len(records)
+
+        prices = np.fromiter(
+            (getattr(data, 'price', 0.0) for data in records),
+            dtype=np.float64, count=count
+        )
+        latencies = np.fromiter(
+            (getattr(data, 'latency_ms', float('inf')) for data in records),
+            dtype=np.float64, count=count
+        )
+        timestamps = np.array(
+            [np.datetime64(getattr(data, 'timestamp', datetime.min)) for data in records],
+            dtype='datetime64[ns]'
+        )
+        # 現在時刻はサイクルに1度だけ取得。レコード側のtimestampは
+        # naiveなdatetime.now()由来なので、比較もnaiveローカル時刻で
+        # 揃える（time.time_ns()のUTC epochと混ぜるとUTCオフセット分ずれる）
+        now_ns = np.datetime64(datetime.now(), 'ns')
+
+        valid_mask = (
+            (prices > 0)
+            & ((now_ns - timestamps).astype('i8') <= 60_000_000_000)
+            & (latencies <= self.config.max_latency_ms)
+        )
+
+        # 有効銘柄の供給は逐次awaitせず一括並行ディスパッチする
+        valid_indices = np.flatnonzero(valid_mask)
+        supply_results = await asyncio.gather(
+            *(self._bounded_supply(symbols[index], records[index]) for index in valid_indices),
+            return_exceptions=True
+        )
+
         processed_count = 0
-        
-        for symbol, data in live_data.items():
-            try:
-                # データ品質チェック
-                if self._validate_data_quality(symbol, data):
-                    # 実取引システムへデータ供給
-                    await self._supply_data_to_trading_system(symbol, data)
-                    processed_count += 1
-                else:
-                    self.logger.warning(f"データ品質不良: {symbol}")
-                    
-            except Exception as e:
-                self.logger.error(f"データ処理エラー {symbol}: {e}")
-        
-        self.logger.info(f"📊 実取引データ処理完了: {processed_count}/{len(live_data)}銘柄")
+        for index, outcome in zip(valid_indices, supply_results):
+            if isinstance(outcome, Exception):
+                self.logger.error("データ処理エラー %s: %s", symbols[index], outcome)
+            else:
+                processed_count += 1
+
+        invalid_count = count - len(valid_indices)
+        if invalid_count:
+            self.logger.warning("データ品質不良: %s銘柄", invalid_count)
+
+        self.logger.info("📊 実取引データ処理完了: %s/%s銘柄", processed_count, count)
     
-    def _validate_data_quality(self, symbol: str, data: Any) -> bool:
-        """データ品質検証"""
-        if not data:
+    def _validate_data_quality(self, symbol: str, data: Any, now: Optional[datetime] = None) -> bool:
+        """データ品質検証（単レコード用。nowは呼び出し側でサイクル毎に1度だけ取得して渡す）"""
+        # 境界での型チェック1回でフィールドの存在を保証し、
+        # 以降はhasattrプローブなしの直接属性アクセスで判定する
+        if not isinstance(data, RealTimeData):
             return False
-        
-        # 基本的な品質チェック
-        if hasattr(data, 'price') and hasattr(data, 'timestamp'):
-            # 価格の妥当性チェック
-            if data.price <= 0:
-                return False
-            
-            # タイムスタンプの新しさチェック
-            if hasattr(data, 'timestamp'):
-                data_age = (datetime.now() - data.timestamp).total_seconds()
-                if data_age > 60:  # 1分以上古い
-                    return False
-            
-            # レイテンシチェック
-            if hasattr(data, 'latency_ms'):
-                if data.latency_ms > self.config.max_latency_ms:
-                    return False
-            
-            return True
-        
-        return False
+
+        if now is None:
+            now = datetime.now()
+
+        return (
+            data.price > 0
+            and (now - data.timestamp).total_seconds() <= 60
+            and data.latency_ms <= self.config.max_latency_ms
+        )
     
+    async def _bounded_supply(self, symbol: str, data: Any):
+        """セマフォで同時実行数を抑えたデータ供給"""
+        async with self._supply_semaphore:
+            await self._supply_data_to_trading_system(symbol, data)
+
     async def _supply_data_to_trading_system(self, symbol: str, data: Any):
         """取引システムへのデータ供給"""
         # 実取引システムへのデータ供給をシミュレート
-        self.logger.debug(f"📤 取引システムへデータ供給: {symbol}")
+        self.logger.debug("📤 取引システムへデータ供給: %s", symbol)
         
         # 実際の実装では、取引システムのAPIを呼び出す
         # trading_system.update_market_data(symbol, data)
@@ -290,27 +418,29 @@ class LiveTradingDataSystem:
         """実取引統計更新"""
         while self.is_running and not self.emergency_stop:
             try:
-                current_time = datetime.now()
-                self.live_stats['uptime_seconds'] = (current_time - self.live_stats['start_time']).total_seconds()
+                self._uptime_seconds = time.monotonic() - self._start_monotonic
                 
-                # 成功率計算
-                total_requests = self.live_stats['total_data_requests']
-                if total_requests > 0:
-                    success_rate = self.live_stats['successful_requests'] / total_requests
-                    self.live_stats['success_rate'] = success_rate
+                # 成功率計算（カウンタが動いた時だけ除算する）
+                total_requests = self._successful_requests + self._failed_requests
+                if total_requests > 0 and total_requests != self._rate_basis:
+                    self._success_rate = self._successful_requests / total_requests
+                    self._rate_basis = total_requests
                 
                 # データ品質スコア更新
-                self.live_stats['data_quality_score'] = self.data_quality_monitor.get_current_quality_score()
+                self._data_quality_score = self.data_quality_monitor.get_current_quality_score()
                 
                 # 統計ログ出力
-                self.logger.info(f"📈 実取引統計: 成功率={self.live_stats.get('success_rate', 0):.2%}, "
-                               f"品質={self.live_stats['data_quality_score']:.2%}, "
-                               f"稼働時間={self.live_stats['uptime_seconds']:.0f}秒")
+                self.logger.info(
+                    "📈 実取引統計: 成功率=%.2f%%, 品質=%.2f%%, 稼働時間=%.0f秒",
+                    self._success_rate * 100,
+                    self._data_quality_score * 100,
+                    self._uptime_seconds
+                )
                 
                 await asyncio.sleep(10)  # 10秒間隔で更新
                 
             except Exception as e:
-                self.logger.error(f"統計更新エラー: {e}")
+                self.logger.error("統計更新エラー: %s", e)
                 await asyncio.sleep(5)
     
     def emergency_stop_system(self):
@@ -319,7 +449,7 @@ class LiveTradingDataSystem:
         self.emergency_stop = True
         self.is_running = False
         self.mode = TradingMode.EMERGENCY_STOP
-        self.live_stats['emergency_stops'] += 1
+        self._emergency_stops += 1
         
         # 分散投資システム停止
         self.distributed_system.stop_system()
@@ -335,6 +465,25 @@ class LiveTradingDataSystem:
             self.distributed_system.stop_system()
             self.logger.info("✅ システムシャットダウン完了")
     
+    @property
+    def success_rate(self) -> float:
+        """直近計算時点のデータ取得成功率"""
+        return self._success_rate
+
+    def _snapshot_live_stats(self) -> Dict[str, Any]:
+        """統計属性を不変のスナップショットdictへ写す"""
+        return {
+            'start_time': self._start_time,
+            'total_data_requests': self._successful_requests + self._failed_requests,
+            'successful_requests': self._successful_requests,
+            'failed_requests': self._failed_requests,
+            'average_latency_ms': self._average_latency_ms,
+            'data_quality_score': self._data_quality_score,
+            'emergency_stops': self._emergency_stops,
+            'uptime_seconds': self._uptime_seconds,
+            'success_rate': self._success_rate
+        }
+
     def get_system_status(self) -> Dict[str, Any]:
         """システム状態取得"""
         return {
@@ -342,7 +491,7 @@ class LiveTradingDataSystem:
             'is_running': self.is_running,
             'emergency_stop': self.emergency_stop,
             'president_approval': self.president_approval,
-            'live_stats': self.live_stats,
+            'live_stats': self._snapshot_live_stats(),
             'data_quality_score': self.data_quality_monitor.get_current_quality_score(),
             'system_components': {
                 'universe_stocks': len(self.distributed_system.universe_manager.stocks),
@@ -355,10 +504,21 @@ class DataQualityMonitor:
     """データ品質監視システム"""
     
     def __init__(self):
-        self.quality_history = []
+        # 品質履歴のSoAリングバッファ: エントリ毎のPythonオブジェクト保持を
+        # やめ、事前確保した構造化配列へ書き込む（1エントリ16バイト、
+        # 集計・エクスポートは連続メモリ上のベクトル演算で行える）
+        self._hist = np.zeros(
+            1000, dtype=[('ts', 'i8'), ('score', 'f4'), ('issues', 'i4')]
+        )
+        self._hist_idx = 0
         self.current_quality_score = 1.0
         self.data_supply_count = 0
-        self.quality_issues = []
+        # 品質問題はO(1)の整数カウンタで集計し、詳細は直近分のみ
+        # 固定長dequeに保持する（1日分の稼働でもリストが伸びない）
+        self.issue_count = 0
+        self.bad_price_count = 0
+        self.high_latency_count = 0
+        self.recent_issues = deque(maxlen=1000)
         self.monitoring_active = False
     
     async def start_monitoring(self):
@@ -371,21 +531,16 @@ class DataQualityMonitor:
                 # 品質スコア計算
                 self._calculate_quality_score()
                 
-                # 品質履歴記録
-                self.quality_history.append({
-                    'timestamp': datetime.now(),
-                    'score': self.current_quality_score,
-                    'issues': len(self.quality_issues)
-                })
-                
-                # 履歴サイズ制限
-                if len(self.quality_history) > 1000:
-                    self.quality_history = self.quality_history[-500:]
+                # 品質履歴記録（リングバッファの現在スロットへ上書き）
+                self._hist[self._hist_idx % 1000] = (
+                    time.time_ns(), self.current_quality_score, self.issue_count
+                )
+                self._hist_idx += 1
                 
                 await asyncio.sleep(5)  # 5秒間隔で監視
                 
             except Exception as e:
-                logger.error(f"品質監視エラー: {e}")
+                logger.error("品質監視エラー: %s", e)
                 await asyncio.sleep(1)
     
     def _calculate_quality_score(self):
@@ -394,24 +549,33 @@ class DataQualityMonitor:
             self.current_quality_score = 1.0
             return
         
-        # 品質問題の割合を計算
-        issue_ratio = len(self.quality_issues) / max(1, self.data_supply_count)
+        # 品質問題の割合を計算（カウンタ参照のみでリスト長計算なし）
+        issue_ratio = self.issue_count / self.data_supply_count
         self.current_quality_score = max(0.0, 1.0 - issue_ratio)
     
     def record_data_supply(self, symbol: str, data: Any):
         """データ供給記録"""
         self.data_supply_count += 1
         
-        # 品質問題のチェック
-        if hasattr(data, 'price') and data.price <= 0:
-            self.quality_issues.append(f"{symbol}: 無効な価格")
-        
-        if hasattr(data, 'latency_ms') and data.latency_ms > 1000:
-            self.quality_issues.append(f"{symbol}: 高レイテンシ")
+        # 品質問題のチェック（ホットパスでは文字列整形せずカウンタ更新のみ）
+        if data.price <= 0:
+            self.bad_price_count += 1
+            self.issue_count += 1
+            self.recent_issues.append((symbol, 'invalid_price'))
+
+        if data.latency_ms > 1000:
+            self.high_latency_count += 1
+            self.issue_count += 1
+            self.recent_issues.append((symbol, 'high_latency'))
     
     def get_current_quality_score(self) -> float:
         """現在の品質スコア取得"""
         return self.current_quality_score
+
+    def history_dataframe(self) -> pd.DataFrame:
+        """品質履歴のDataFrameエクスポート（構造化配列からのゼロコピー）"""
+        valid = min(self._hist_idx, len(self._hist))
+        return pd.DataFrame(self._hist[:valid])
     
     def stop_monitoring(self):
         """品質監視停止"""
@@ -437,12 +601,18 @@ async def main():
         
         # システム状態確認
         status = live_system.get_system_status()
-        logger.info(f"💹 システム状態: {json.dumps(status, indent=2, ensure_ascii=False)}")
+        if orjson is not None:
+            status_json = orjson.dumps(
+                status, option=orjson.OPT_INDENT_2, default=str
+            ).decode()
+        else:
+            status_json = json.dumps(status, indent=2, ensure_ascii=False, default=str)
+        logger.info("💹 システム状態: %s", status_json)
         
     except KeyboardInterrupt:
         logger.info("🛑 ユーザーによる停止要求")
     except Exception as e:
-        logger.error(f"❌ システムエラー: {e}")
+        logger.error("❌ システムエラー: %s", e)
     finally:
         live_system.shutdown_system()
     
@@ -18,9 +18,13 @@ import sys
 import os
 import time
 import json
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -88,6 +92,100 @@ class SystemPerformance:
     error_count: int
 
 
+class MetricsBuffer:
+    """メトリクス履歴のSoA（Structure of Arrays）バッファ
+
+    List[LiveTradingMetrics]はtick毎にオブジェクトを抱えたまま
+    無制限に伸長し、レポート集計のたびに全件をPythonループで
+    なめる必要があった。レポートで使う数値列だけをnumpy配列の
+    列として保持し、容量は倍々成長でO(1)償却の追記にする。
+    集計側は capitals[:n] のようにスライスして参照する。
+    """
+
+    _INITIAL_CAPACITY = 1024
+    _COLUMNS = ('timestamps', 'capitals', 'pnls', 'win_rates',
+                'analysis_times', 'success_rates', 'error_counts')
+
+    def __init__(self):
+        import numpy as np
+        self._np = np
+        self.n = 0
+        self._capacity = self._INITIAL_CAPACITY
+        self.timestamps = np.zeros(self._capacity, dtype='i8')  # epoch ns
+        self.capitals = np.zeros(self._capacity, dtype='f8')
+        self.pnls = np.zeros(self._capacity, dtype='f8')
+        self.win_rates = np.zeros(self._capacity, dtype='f8')
+        self.analysis_times = np.zeros(self._capacity, dtype='f8')
+        self.success_rates = np.zeros(self._capacity, dtype='f8')
+        self.error_counts = np.zeros(self._capacity, dtype='i8')
+
+    def _grow(self):
+        """容量を倍に拡張（既存データはコピー）"""
+        self._capacity *= 2
+        for name in self._COLUMNS:
+            old_column = getattr(self, name)
+            new_column = self._np.zeros(self._capacity, dtype=old_column.dtype)
+            new_column[:old_column.shape[0]] = old_column
+            setattr(self, name, new_column)
+
+    def append(self, metrics: 'LiveTradingMetrics'):
+        """メトリクス1件を列に分解して追記"""
+        if self.n >= self._capacity:
+            self._grow()
+
+        i = self.n
+        self.timestamps[i] = int(metrics.timestamp.timestamp() * 1e9)
+        self.capitals[i] = metrics.total_capital
+        self.pnls[i] = metrics.total_pnl
+        self.win_rates[i] = metrics.win_rate
+        self.analysis_times[i] = metrics.system_performance['total_analysis_time']
+        self.success_rates[i] = metrics.system_performance['success_rate']
+        self.error_counts[i] = metrics.system_performance['error_count']
+        self.n = i + 1
+
+
+# 年率化係数（252営業日）
+SQRT252 = 252 ** 0.5
+
+
+@lru_cache(maxsize=8)
+def _build_mock_market_data(day, symbols: Tuple[str, ...]) -> Dict:
+    """仮想市場データ構築（日付と銘柄タプルでメモ化）
+
+    シードが固定で出力は決定的なため、監視tick毎に同じ60日分の
+    OHLCVを作り直す必要はない。リターンは(日数, 銘柄数)の行列として
+    1回で生成し、cumsum/expも全銘柄まとめて1パスで計算する。
+    """
+    import pandas as pd
+    import numpy as np
+
+    dates = pd.date_range(
+        start=datetime.combine(day, datetime.min.time()) - timedelta(days=60),
+        end=datetime.combine(day, datetime.min.time()),
+        freq='D'
+    )
+
+    rng = np.random.default_rng(42)
+    base_prices = rng.uniform(1000, 3000, len(symbols))
+    returns = rng.standard_normal((len(dates), len(symbols))) * 0.015
+    prices = base_prices * np.exp(np.cumsum(returns, axis=0))
+    volumes = rng.uniform(100000, 1000000, (len(dates), len(symbols)))
+
+    market_data = {}
+    for i, symbol in enumerate(symbols):
+        close = prices[:, i]
+        market_data[symbol] = pd.DataFrame({
+            'Date': dates,
+            'Open': close * 0.995,
+            'High': close * 1.005,
+            'Low': close * 0.995,
+            'Close': close,
+            'Volume': volumes[:, i]
+        }).set_index('Date')
+
+    return market_data
+
+
 class Phase1LiveTradingMonitor:
     """
     Phase 1 実取引検証監視システム
@@ -100,12 +198,18 @@ class Phase1LiveTradingMonitor:
     
     def __init__(self, config: Phase1Config = None):
         self.config = config or Phase1Config()
+        # 1実行分の全出力ファイル（ログ・レポート・メトリクス）で共有するID
+        # strftimeを出力のたびに呼び直すと実行途中でファイル名がずれる
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.logger = self._setup_logger()
         
         # 監視状態
         self.monitoring_active = False
         self.start_time = None
-        self.phase1_metrics: List[LiveTradingMetrics] = []
+        self._start_time_iso = None
+        self._metrics_file = None
+        self.metrics_buffer = MetricsBuffer()
+        self._latest_metrics: Optional[LiveTradingMetrics] = None
         
         # システム初期化
         self._initialize_systems()
@@ -114,6 +218,30 @@ class Phase1LiveTradingMonitor:
         self.monitoring_thread = None
         self.alert_thread = None
         
+        # 3システム並列実行用（tick毎の生成コストを避けて使い回す）
+        self._analysis_executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix='analysis'
+        )
+        
+        # 増分ドローダウン追跡（資本ピークと最大DDをO(1)で更新）
+        self._capital_peak = self.config.initial_capital
+        self._max_drawdown = 0.0
+        
+        # 増分シャープレシオ集計（リターンの累積和・二乗和をO(1)更新）
+        self._last_capital = None
+        self._return_sum = 0.0
+        self._return_sq_sum = 0.0
+        self._return_count = 0
+        
+        # 増分PnL集計（order_historyの毎tick再走査を回避）
+        self._pnl_stats = {
+            'realized_pnl': 0.0,
+            'win_count': 0,
+            'trade_count': 0,
+            'gross_profit': 0.0,
+            'gross_loss': 0.0
+        }
+        
         # 統計追跡
         self.stats = {
             'total_trades': 0,
@@ -128,12 +256,17 @@ class Phase1LiveTradingMonitor:
         self.logger.info(f"検証期間: {self.config.verification_days}日間")
     
     def _setup_logger(self) -> logging.Logger:
-        """ログ設定"""
+        """ログ設定
+
+        ファイル/コンソールへの整形・書き込みは監視スレッドを
+        ブロックしないよう、QueueHandler経由でリスナースレッドに
+        委譲する（監視側のログコストはキューputのみ）。
+        """
         logger = logging.getLogger('Phase1LiveTradingMonitor')
         logger.setLevel(logging.INFO)
         
         # ファイルハンドラー
-        log_file = f'phase1_live_trading_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+        log_file = f'phase1_live_trading_{self.run_id}.log'
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(logging.INFO)
         
@@ -141,45 +274,63 @@ class Phase1LiveTradingMonitor:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         
-        # フォーマッター
+        # フォーマッター（両ハンドラーで共有）
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # 監視スレッド側はキューputだけで復帰し、
+        # 実際のIOはリスナースレッドが処理する
+        log_queue = SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        
+        self._log_listener = QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
         
         return logger
     
     def _initialize_systems(self):
         """システム初期化"""
-        try:
-            # 3システム初期化
-            self.multi_analyzer = MultiStockAnalyzer()
-            self.portfolio_connector = PortfolioExpertConnector()
-            self.dynamic_manager = DynamicPortfolioManager()
-            
-            # 銘柄ユニバース
-            self.stock_universe = StockUniverse()
-            
-            # テスト用銘柄（Phase 1用）
-            self.test_symbols = ['8306.T', '4689.T', '9984.T', '6758.T', '7203.T']
-            
-            # 仮想ポートフォリオ初期化
-            self.virtual_portfolio = {
-                'cash': self.config.initial_capital,
-                'positions': {},
-                'order_history': [],
-                'performance_history': []
-            }
-            
-            self.logger.info("✅ 3システム初期化完了")
-            
-        except Exception as e:
-            self.logger.error(f"❌ システム初期化エラー: {e}")
-            self.logger.info("💡 シミュレーションモードで継続")
+        # 3システムはcached_propertyで初回利用時に構築
+        # （Prophet等の重い依存を監視開始前に読み込まない）
+
+        # テスト用銘柄（Phase 1用）
+        self.test_symbols = ['8306.T', '4689.T', '9984.T', '6758.T', '7203.T']
+
+        # 仮想ポートフォリオ初期化
+        self.virtual_portfolio = {
+            'cash': self.config.initial_capital,
+            'positions': {},
+            'order_history': [],
+            'performance_history': []
+        }
+
+        self.logger.info("✅ 監視設定初期化完了（3システムは初回利用時に構築）")
+
+    @cached_property
+    def multi_analyzer(self):
+        """複数銘柄同時分析エンジン（初回アクセス時に構築）"""
+        return MultiStockAnalyzer()
+
+    @cached_property
+    def portfolio_connector(self):
+        """外部専門家連携システム（初回アクセス時に構築）"""
+        return PortfolioExpertConnector()
+
+    @cached_property
+    def dynamic_manager(self):
+        """動的ポートフォリオ管理（初回アクセス時に構築）"""
+        return DynamicPortfolioManager()
+
+    @cached_property
+    def stock_universe(self):
+        """銘柄ユニバース（初回アクセス時に構築）"""
+        return StockUniverse()
     
     def start_phase1_monitoring(self):
         """Phase 1 監視開始"""
@@ -189,6 +340,13 @@ class Phase1LiveTradingMonitor:
         
         self.monitoring_active = True
         self.start_time = datetime.now()
+        self._start_time_iso = self.start_time.isoformat()
+        
+        # メトリクスは追記専用JSONLとして逐次書き出す（行バッファリング）
+        # 終了時の一括ダンプと違い、異常終了しても取得済み分は残る
+        self._metrics_file = open(
+            f'phase1_metrics_{self.run_id}.jsonl', 'a', buffering=1, encoding='utf-8'
+        )
         
         self.logger.info("🚀 Phase 1 実取引検証監視開始")
         self.logger.info(f"開始時刻: {self.start_time}")
@@ -224,7 +382,14 @@ class Phase1LiveTradingMonitor:
                     
                     # メトリクス更新
                     metrics = self._calculate_current_metrics(performance_data)
-                    self.phase1_metrics.append(metrics)
+                    self.metrics_buffer.append(metrics)
+                    self._latest_metrics = metrics
+                    
+                    # 1tick=1行で逐次永続化
+                    if self._metrics_file is not None:
+                        self._metrics_file.write(
+                            json.dumps(asdict(metrics), default=str) + '\n'
+                        )
                     
                     # リアルタイム報告
                     self._generate_realtime_report(metrics)
@@ -263,19 +428,51 @@ class Phase1LiveTradingMonitor:
             error_count=0
         )
         
-        total_start = time.time()
+        # 計測は壁時計でなく単調クロック（NTP補正の影響を受けない）
+        total_start_ns = time.perf_counter_ns()
         
         try:
             # 仮想市場データ生成（実際は外部APIから取得）
             market_data = self._generate_mock_market_data()
             
-            # 1. MultiStockAnalyzer実行
-            start_time = time.time()
-            try:
-                analysis_results = self.multi_analyzer.analyze_multiple_stocks(
+            # 3システムは互いに独立なので並列実行する
+            # （各タスクが自分の実行時間を計測して返す）
+            def run_multi_analyzer():
+                start_ns = time.perf_counter_ns()
+                results = self.multi_analyzer.analyze_multiple_stocks(
                     self.test_symbols, market_data
                 )
-                performance.multi_analyzer_time = time.time() - start_time
+                return time.perf_counter_ns() - start_ns, results
+            
+            def run_portfolio_connector():
+                start_ns = time.perf_counter_ns()
+                result = self.portfolio_connector.analyze_with_experts(
+                    self.test_symbols, market_data, self.config.initial_capital
+                )
+                return time.perf_counter_ns() - start_ns, result
+            
+            def run_dynamic_manager():
+                start_ns = time.perf_counter_ns()
+                if not hasattr(self.dynamic_manager, 'portfolio_state') or self.dynamic_manager.portfolio_state is None:
+                    # 初期化
+                    self.dynamic_manager.initialize_portfolio(
+                        self.test_symbols, self.config.initial_capital, market_data
+                    )
+                else:
+                    # 監視・管理
+                    rebalance_action = self.dynamic_manager.monitor_and_manage(market_data)
+                    if rebalance_action:
+                        self.logger.info(f"🔄 リバランス: {rebalance_action.signal.value}")
+                return time.perf_counter_ns() - start_ns, None
+            
+            multi_future = self._analysis_executor.submit(run_multi_analyzer)
+            connector_future = self._analysis_executor.submit(run_portfolio_connector)
+            manager_future = self._analysis_executor.submit(run_dynamic_manager)
+            
+            # 1. MultiStockAnalyzer結果回収
+            try:
+                multi_ns, analysis_results = multi_future.result()
+                performance.multi_analyzer_time = multi_ns * 1e-9
                 self.logger.info(f"✅ MultiStockAnalyzer: {len(analysis_results)}銘柄分析完了")
                 
             except Exception as e:
@@ -283,13 +480,10 @@ class Phase1LiveTradingMonitor:
                 performance.error_count += 1
                 analysis_results = []
             
-            # 2. PortfolioExpertConnector実行
-            start_time = time.time()
+            # 2. PortfolioExpertConnector結果回収
             try:
-                recommendation = self.portfolio_connector.analyze_with_experts(
-                    self.test_symbols, market_data, self.config.initial_capital
-                )
-                performance.portfolio_connector_time = time.time() - start_time
+                connector_ns, recommendation = connector_future.result()
+                performance.portfolio_connector_time = connector_ns * 1e-9
                 self.logger.info(f"✅ PortfolioExpertConnector: 推奨生成完了")
                 
             except Exception as e:
@@ -297,21 +491,10 @@ class Phase1LiveTradingMonitor:
                 performance.error_count += 1
                 recommendation = None
             
-            # 3. DynamicPortfolioManager実行
-            start_time = time.time()
+            # 3. DynamicPortfolioManager結果回収
             try:
-                if not hasattr(self.dynamic_manager, 'portfolio_state') or self.dynamic_manager.portfolio_state is None:
-                    # 初期化
-                    portfolio_state = self.dynamic_manager.initialize_portfolio(
-                        self.test_symbols, self.config.initial_capital, market_data
-                    )
-                else:
-                    # 監視・管理
-                    rebalance_action = self.dynamic_manager.monitor_and_manage(market_data)
-                    if rebalance_action:
-                        self.logger.info(f"🔄 リバランス: {rebalance_action.signal.value}")
-                
-                performance.dynamic_manager_time = time.time() - start_time
+                manager_ns, _ = manager_future.result()
+                performance.dynamic_manager_time = manager_ns * 1e-9
                 self.logger.info(f"✅ DynamicPortfolioManager: 管理完了")
                 
             except Exception as e:
@@ -319,7 +502,7 @@ class Phase1LiveTradingMonitor:
                 performance.error_count += 1
             
             # 総合性能計算
-            performance.total_analysis_time = time.time() - total_start
+            performance.total_analysis_time = (time.perf_counter_ns() - total_start_ns) * 1e-9
             performance.success_rate = (3 - performance.error_count) / 3.0
             
             return performance
@@ -331,39 +514,31 @@ class Phase1LiveTradingMonitor:
             return performance
     
     def _generate_mock_market_data(self) -> Dict:
-        """仮想市場データ生成（実際は外部APIから取得）"""
-        import pandas as pd
-        import numpy as np
-        
-        market_data = {}
-        
-        for symbol in self.test_symbols:
-            # 60日分のデータ
-            dates = pd.date_range(
-                start=datetime.now() - timedelta(days=60),
-                end=datetime.now(),
-                freq='D'
-            )
-            
-            # 価格データ（簡易シミュレーション）
-            np.random.seed(42)
-            base_price = np.random.uniform(1000, 3000)
-            returns = np.random.normal(0, 0.015, len(dates))
-            prices = base_price * np.exp(np.cumsum(returns))
-            
-            # 出来高データ
-            volumes = np.random.uniform(100000, 1000000, len(dates))
-            
-            market_data[symbol] = pd.DataFrame({
-                'Date': dates,
-                'Open': prices * 0.995,
-                'High': prices * 1.005,
-                'Low': prices * 0.995,
-                'Close': prices,
-                'Volume': volumes
-            }).set_index('Date')
-        
-        return market_data
+        """仮想市場データ取得（実際は外部APIから取得）
+
+        シード固定の決定的データのため、同一日・同一銘柄リストなら
+        メモ化済みのDataFrameをそのまま返す（tick毎の再構築なし）。
+        """
+        return _build_mock_market_data(datetime.now().date(), tuple(self.test_symbols))
+    
+    def _record_order(self, order: Dict):
+        """注文履歴への記録とPnL集計の増分更新
+
+        order_historyはレポート用の生履歴として残しつつ、
+        実現損益・勝率・プロフィットファクターの元になる集計値は
+        記録時にO(1)で更新する（tick毎の全走査4回を置き換え）。
+        """
+        self.virtual_portfolio['order_history'].append(order)
+        
+        pnl = order.get('pnl', 0)
+        stats = self._pnl_stats
+        stats['realized_pnl'] += pnl
+        stats['trade_count'] += 1
+        if pnl > 0:
+            stats['win_count'] += 1
+            stats['gross_profit'] += pnl
+        elif pnl < 0:
+            stats['gross_loss'] += abs(pnl)
     
     def _calculate_current_metrics(self, performance: SystemPerformance) -> LiveTradingMetrics:
         """現在のメトリクス計算"""
@@ -373,20 +548,19 @@ class Phase1LiveTradingMonitor:
         for symbol, position in self.virtual_portfolio['positions'].items():
             total_capital += position.get('value', 0)
         
-        # PnL計算
-        realized_pnl = sum(order.get('pnl', 0) for order in self.virtual_portfolio['order_history'])
+        # PnL計算（_record_orderで更新済みの増分集計を参照）
+        pnl_stats = self._pnl_stats
+        realized_pnl = pnl_stats['realized_pnl']
         unrealized_pnl = total_capital - self.config.initial_capital - realized_pnl
         total_pnl = realized_pnl + unrealized_pnl
         
         # 勝率計算
-        profitable_trades = len([o for o in self.virtual_portfolio['order_history'] if o.get('pnl', 0) > 0])
-        total_trades = len(self.virtual_portfolio['order_history'])
-        win_rate = (profitable_trades / total_trades) if total_trades > 0 else 0.0
+        total_trades = pnl_stats['trade_count']
+        win_rate = (pnl_stats['win_count'] / total_trades) if total_trades > 0 else 0.0
         
         # プロフィットファクター計算
-        total_profit = sum(o.get('pnl', 0) for o in self.virtual_portfolio['order_history'] if o.get('pnl', 0) > 0)
-        total_loss = abs(sum(o.get('pnl', 0) for o in self.virtual_portfolio['order_history'] if o.get('pnl', 0) < 0))
-        profit_factor = (total_profit / total_loss) if total_loss > 0 else 0.0
+        total_loss = pnl_stats['gross_loss']
+        profit_factor = (pnl_stats['gross_profit'] / total_loss) if total_loss > 0 else 0.0
         
         # システム性能データ
         system_performance = {
@@ -408,81 +582,89 @@ class Phase1LiveTradingMonitor:
             total_pnl=total_pnl,
             win_rate=win_rate,
             profit_factor=profit_factor,
-            max_drawdown=self._calculate_max_drawdown(),
-            sharpe_ratio=self._calculate_sharpe_ratio(),
+            max_drawdown=self._calculate_max_drawdown(total_capital),
+            sharpe_ratio=self._calculate_sharpe_ratio(total_capital),
             system_performance=system_performance
         )
     
-    def _calculate_max_drawdown(self) -> float:
-        """最大ドローダウン計算"""
-        if not self.phase1_metrics:
-            return 0.0
-        
-        peak = self.config.initial_capital
-        max_drawdown = 0.0
+    def _calculate_max_drawdown(self, total_capital: float) -> float:
+        """最大ドローダウン計算（ランニングピークの増分更新）
+
+        過去メトリクス全件をtick毎に再走査する代わりに、資本ピークと
+        最大ドローダウンをスカラーで保持してO(1)で更新する。
+        """
+        if total_capital > self._capital_peak:
+            self._capital_peak = total_capital
         
-        for metrics in self.phase1_metrics:
-            if metrics.total_capital > peak:
-                peak = metrics.total_capital
-            
-            drawdown = (peak - metrics.total_capital) / peak
-            max_drawdown = max(max_drawdown, drawdown)
+        drawdown = (self._capital_peak - total_capital) / self._capital_peak
+        if drawdown > self._max_drawdown:
+            self._max_drawdown = drawdown
         
-        return max_drawdown
+        return self._max_drawdown
     
-    def _calculate_sharpe_ratio(self) -> float:
-        """シャープレシオ計算"""
-        if len(self.phase1_metrics) < 2:
-            return 0.0
-        
-        returns = []
-        for i in range(1, len(self.phase1_metrics)):
-            prev_capital = self.phase1_metrics[i-1].total_capital
-            current_capital = self.phase1_metrics[i].total_capital
-            
-            if prev_capital > 0:
-                daily_return = (current_capital - prev_capital) / prev_capital
-                returns.append(daily_return)
-        
-        if not returns:
+    def _calculate_sharpe_ratio(self, total_capital: float) -> float:
+        """シャープレシオ計算（リターン累積和によるO(1)増分更新）
+
+        メトリクス履歴からリターン列をtick毎に再構築する代わりに、
+        リターンの和・二乗和・件数を保持し、平均と標準偏差を
+        閉形式で求める。
+        """
+        prev_capital = self._last_capital
+        self._last_capital = total_capital
+        
+        if prev_capital is not None and prev_capital > 0:
+            tick_return = (total_capital - prev_capital) / prev_capital
+            self._return_sum += tick_return
+            self._return_sq_sum += tick_return * tick_return
+            self._return_count += 1
+        
+        if self._return_count < 1:
             return 0.0
         
-        import numpy as np
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
+        mean_return = self._return_sum / self._return_count
+        variance = self._return_sq_sum / self._return_count - mean_return * mean_return
         
-        if std_return == 0:
+        if variance <= 0:
             return 0.0
         
         # 年率化（252営業日）
-        return (mean_return * 252) / (std_return * np.sqrt(252))
+        return (mean_return * 252) / (variance ** 0.5 * SQRT252)
     
     def _generate_realtime_report(self, metrics: LiveTradingMetrics):
-        """リアルタイム報告生成"""
-        self.logger.info("📊 リアルタイム監視レポート")
-        self.logger.info(f"時刻: {metrics.timestamp}")
-        self.logger.info(f"総資本: {metrics.total_capital:,.0f}円")
-        self.logger.info(f"総損益: {metrics.total_pnl:+,.0f}円 ({metrics.total_pnl/self.config.initial_capital:+.1%})")
-        self.logger.info(f"勝率: {metrics.win_rate:.1%}")
-        self.logger.info(f"プロフィットファクター: {metrics.profit_factor:.2f}")
-        self.logger.info(f"最大ドローダウン: {metrics.max_drawdown:.1%}")
-        
-        # システム性能
-        self.logger.info("🔧 システム性能:")
-        self.logger.info(f"  MultiStockAnalyzer: {metrics.system_performance['multi_analyzer_time']:.1f}秒")
-        self.logger.info(f"  PortfolioExpertConnector: {metrics.system_performance['portfolio_connector_time']:.1f}秒")
-        self.logger.info(f"  DynamicPortfolioManager: {metrics.system_performance['dynamic_manager_time']:.1f}秒")
-        self.logger.info(f"  総分析時間: {metrics.system_performance['total_analysis_time']:.1f}秒")
-        self.logger.info(f"  成功率: {metrics.system_performance['success_rate']:.1%}")
-        
-        # Phase 1 基準チェック
+        """リアルタイム報告生成
+
+        1tick分のレポートはLogRecord1件にまとめて発行する。
+        行ごとの15回のlogger呼び出し（レコード生成・キューput）を
+        1回に集約し、マルチスレッド出力時の行の混在も防ぐ。
+        """
+        perf = metrics.system_performance
         profit_rate = metrics.total_pnl / self.config.initial_capital
+        
+        lines = [
+            "📊 リアルタイム監視レポート",
+            f"時刻: {metrics.timestamp}",
+            f"総資本: {metrics.total_capital:,.0f}円",
+            f"総損益: {metrics.total_pnl:+,.0f}円 ({profit_rate:+.1%})",
+            f"勝率: {metrics.win_rate:.1%}",
+            f"プロフィットファクター: {metrics.profit_factor:.2f}",
+            f"最大ドローダウン: {metrics.max_drawdown:.1%}",
+            "🔧 システム性能:",
+            f"  MultiStockAnalyzer: {perf['multi_analyzer_time']:.1f}秒",
+            f"  PortfolioExpertConnector: {perf['portfolio_connector_time']:.1f}秒",
+            f"  DynamicPortfolioManager: {perf['dynamic_manager_time']:.1f}秒",
+            f"  総分析時間: {perf['total_analysis_time']:.1f}秒",
+            f"  成功率: {perf['success_rate']:.1%}",
+        ]
+        
+        # Phase 1 基準チェック（達成分だけ行を追加）
         if profit_rate >= 0.03:
-            self.logger.info("✅ Phase 1 利益率基準達成（3%以上）")
+            lines.append("✅ Phase 1 利益率基準達成（3%以上）")
         if metrics.win_rate >= 0.6:
-            self.logger.info("✅ Phase 1 勝率基準達成（60%以上）")
+            lines.append("✅ Phase 1 勝率基準達成（60%以上）")
         if metrics.max_drawdown <= 0.05:
-            self.logger.info("✅ Phase 1 ドローダウン基準達成（5%以下）")
+            lines.append("✅ Phase 1 ドローダウン基準達成（5%以下）")
+        
+        self.logger.info("\n".join(lines))
     
     def _check_emergency_stop(self, metrics: LiveTradingMetrics) -> bool:
         """緊急停止チェック"""
@@ -504,8 +686,8 @@ class Phase1LiveTradingMonitor:
         """アラート監視"""
         while self.monitoring_active:
             try:
-                if self.phase1_metrics:
-                    latest_metrics = self.phase1_metrics[-1]
+                latest_metrics = self._latest_metrics
+                if latest_metrics is not None:
                     
                     # アラート条件チェック
                     loss_ratio = latest_metrics.total_pnl / self.config.initial_capital
@@ -555,7 +737,7 @@ class Phase1LiveTradingMonitor:
         self.logger.info(report)
         
         # レポートファイル保存
-        with open(f'phase1_initial_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md', 'w', encoding='utf-8') as f:
+        with open(f'phase1_initial_report_{self.run_id}.md', 'w', encoding='utf-8') as f:
             f.write(report)
     
     def stop_monitoring(self):
@@ -568,23 +750,28 @@ class Phase1LiveTradingMonitor:
         if self.alert_thread:
             self.alert_thread.join(timeout=5)
         
+        if self._metrics_file is not None:
+            self._metrics_file.close()
+            self._metrics_file = None
+        
         self.logger.info("🛑 Phase 1 監視停止")
         self._generate_final_report()
     
     def _generate_final_report(self):
         """最終レポート生成"""
-        if not self.phase1_metrics:
+        buf = self.metrics_buffer
+        if buf.n == 0:
             self.logger.warning("⚠️ メトリクスデータなし")
             return
         
-        final_metrics = self.phase1_metrics[-1]
+        final_metrics = self._latest_metrics
         duration = datetime.now() - self.start_time
         
         report = f"""
 📋 Phase 1 実取引検証最終レポート
 
 ⏱️ 検証期間: {duration}
-📊 総データポイント: {len(self.phase1_metrics)}
+📊 総データポイント: {buf.n}
 
 💰 最終結果:
 - 最終資本: {final_metrics.total_capital:,.0f}円
@@ -601,9 +788,9 @@ class Phase1LiveTradingMonitor:
 - ドローダウン5%以下: {'✅' if final_metrics.max_drawdown <= 0.05 else '❌'}
 
 🔧 システム性能:
-- 平均分析時間: {sum(m.system_performance['total_analysis_time'] for m in self.phase1_metrics) / len(self.phase1_metrics):.1f}秒
-- 平均成功率: {sum(m.system_performance['success_rate'] for m in self.phase1_metrics) / len(self.phase1_metrics):.1%}
-- 総エラー数: {sum(m.system_performance['error_count'] for m in self.phase1_metrics)}
+- 平均分析時間: {buf.analysis_times[:buf.n].mean():.1f}秒
+- 平均成功率: {buf.success_rates[:buf.n].mean():.1%}
+- 総エラー数: {int(buf.error_counts[:buf.n].sum())}
 
 📈 統計:
 - 総取引数: {self.stats['total_trades']}
@@ -619,12 +806,9 @@ class Phase1LiveTradingMonitor:
         self.logger.info(report)
         
         # 最終レポートファイル保存
-        with open(f'phase1_final_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md', 'w', encoding='utf-8') as f:
+        with open(f'phase1_final_report_{self.run_id}.md', 'w', encoding='utf-8') as f:
             f.write(report)
-        
-        # メトリクスデータ保存
-        with open(f'phase1_metrics_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json', 'w') as f:
-            json.dump([asdict(m) for m in self.phase1_metrics], f, indent=2, default=str)
+
     
     def _check_phase2_ready(self, final_metrics: LiveTradingMetrics) -> bool:
         """Phase 2 準備完了チェック"""
@@ -636,16 +820,16 @@ class Phase1LiveTradingMonitor:
     
     def get_current_status(self) -> Dict:
         """現在の状況取得"""
-        if not self.phase1_metrics:
+        latest = self._latest_metrics
+        if latest is None:
             return {'status': 'no_data'}
         
-        latest = self.phase1_metrics[-1]
         return {
             'monitoring_active': self.monitoring_active,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'start_time': self._start_time_iso,
             'latest_metrics': asdict(latest),
             'stats': self.stats,
-            'phase1_ready': self._check_phase2_ready(latest) if self.phase1_metrics else False
+            'phase1_ready': self._check_phase2_ready(latest)
         }
 
 
@@ -720,8 +720,8 @@ Phase 1 状況: {phase1_status}
         if not results:
             return 0
         
-        success_count = sum(1 for item in results.values() if item['trading_result'])
-        return success_count / len(results)
+        successes = np.fromiter((bool(item['trading_result']) for item in results.values()), dtype=bool)
+        return np.count_nonzero(successes) / len(results)
     
     def _calculate_final_portfolio_value(self):
         """最終ポートフォリオ価値計算"""
@@ -22,6 +22,7 @@ import logging
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import warnings
@@ -99,6 +100,9 @@ class PostDataFixAnalysisVerification:
         # 結果格納
         self.verification_results = []
         self.quality_metrics = []
+
+        # 銘柄別市場データキャッシュ（5回の検証パスでの再生成を防止）
+        self._market_data_cache: Dict[str, pd.DataFrame] = {}
         
         self.logger.info("🔧 Post Data Fix Analysis Verification 初期化完了")
         self.logger.info(f"data_engineer修正完了確認: 廃止銘柄{self.data_quality_improvements['excluded_delisted_stocks']}銘柄除外")
@@ -109,14 +113,16 @@ class PostDataFixAnalysisVerification:
         """ログ設定"""
         logger = logging.getLogger('PostDataFixVerification')
         logger.setLevel(logging.INFO)
-        
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
+
+        # 再インスタンス化時のハンドラー重複（多重出力）を防止
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
         return logger
     
     def _get_clean_symbol_list(self) -> List[str]:
@@ -217,60 +223,76 @@ class PostDataFixAnalysisVerification:
     def _verify_all_analysis_engines(self) -> List[AnalysisEngineResult]:
         """4つの分析エンジン検証"""
         self.logger.info("🔍 4つの分析エンジン検証開始")
-        
-        engine_results = []
-        
-        # 1. AdvancedTechnicalIndicators検証
-        technical_result = self._verify_technical_indicators()
-        engine_results.append(technical_result)
-        
-        # 2. CandlestickPatternAnalyzer検証
-        pattern_result = self._verify_candlestick_patterns()
-        engine_results.append(pattern_result)
-        
-        # 3. GranvilleAnalyzer検証
-        granville_result = self._verify_granville_analyzer()
-        engine_results.append(granville_result)
-        
-        # 4. ProphetPredictor検証
-        prophet_result = self._verify_prophet_predictor()
-        engine_results.append(prophet_result)
-        
-        self.logger.info(f"✅ 4つの分析エンジン検証完了")
-        
+
+        # 4エンジンは共有状態を持たないため並列検証可能
+        engine_verifiers = [
+            self._verify_technical_indicators,   # 1. AdvancedTechnicalIndicators検証
+            self._verify_candlestick_patterns,   # 2. CandlestickPatternAnalyzer検証
+            self._verify_granville_analyzer,     # 3. GranvilleAnalyzer検証
+            self._verify_prophet_predictor       # 4. ProphetPredictor検証
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(engine_verifiers)) as executor:
+            futures = [executor.submit(verifier) for verifier in engine_verifiers]
+            engine_results = [future.result() for future in futures]
+
+        # 並列実行中の逐次ログ出力は行が交錯するため、完了後に一括出力
+        summary_lines = ["✅ 4つの分析エンジン検証完了"]
+        for result in engine_results:
+            summary_lines.append(
+                f"   {result.engine_name}: "
+                f"成功率 {result.success_rate:.1%} / "
+                f"精度 {result.accuracy_score:.2f} / "
+                f"一貫性 {result.consistency_score:.2f} / "
+                f"処理時間 {result.processing_time:.1f}秒"
+            )
+        self.logger.info("\n".join(summary_lines))
+
         return engine_results
     
     def _verify_technical_indicators(self) -> AnalysisEngineResult:
         """テクニカル指標分析検証"""
         self.logger.info("📈 AdvancedTechnicalIndicators検証")
         
-        start_time = time.time()
+        # 壁時計time.time()ではなく単調・高分解能のperf_counterで計測
+        start_time = time.perf_counter()
         successful_analyses = 0
         total_analyses = len(self.target_symbols)
-        accuracy_scores = []
-        consistency_scores = []
+        # 事前確保したバッファへ書き込み、Pythonリストの伸長を避ける
+        accuracy_scores = np.empty(total_analyses)
+        consistency_scores = np.empty(total_analyses)
         
         # クリーンデータでのテクニカル分析
         for symbol in self.target_symbols:
             try:
                 # 修正後データでのテクニカル指標計算
-                market_data = self._generate_clean_market_data(symbol)
+                market_data = self._get_market_data(symbol)
                 
                 # 26種類テクニカル指標計算
                 technical_scores = self._calculate_technical_indicators(market_data)
-                
-                if technical_scores and len(technical_scores) >= 20:  # 26指標中20以上成功
+
+                # 有効指標数はPythonループではなくnumpyの一括判定で数える
+                values = np.fromiter(
+                    (v for v in technical_scores.values() if isinstance(v, (int, float))),
+                    dtype=np.float64
+                ) if technical_scores else np.empty(0)
+                valid_indicators = int(np.isfinite(values).sum())
+
+                if valid_indicators >= 20:  # 26指標中20以上成功
+                    accuracy_scores[successful_analyses] = self._evaluate_technical_accuracy(technical_scores)
+                    consistency_scores[successful_analyses] = self._evaluate_consistency(technical_scores)
                     successful_analyses += 1
-                    accuracy_scores.append(self._evaluate_technical_accuracy(technical_scores))
-                    consistency_scores.append(self._evaluate_consistency(technical_scores))
                 
             except Exception as e:
-                self.logger.error(f"❌ {symbol} テクニカル分析エラー: {e}")
+                self.logger.error(
+                    f"❌ {symbol} テクニカル分析エラー: {type(e).__name__}: {e}",
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG)
+                )
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         success_rate = successful_analyses / total_analyses if total_analyses > 0 else 0
-        avg_accuracy = np.mean(accuracy_scores) if accuracy_scores else 0
-        avg_consistency = np.mean(consistency_scores) if consistency_scores else 0
+        avg_accuracy = float(accuracy_scores[:successful_analyses].mean()) if successful_analyses else 0
+        avg_consistency = float(consistency_scores[:successful_analyses].mean()) if successful_analyses else 0
         
         # data_engineer修正による改善効果
         improvement_metrics = {
@@ -290,44 +312,44 @@ class PostDataFixAnalysisVerification:
             improvement_metrics=improvement_metrics
         )
         
-        self.logger.info(f"✅ テクニカル指標検証完了")
-        self.logger.info(f"   成功率: {success_rate:.1%}")
-        self.logger.info(f"   精度: {avg_accuracy:.2f}")
-        self.logger.info(f"   一貫性: {avg_consistency:.2f}")
-        
         return result
     
     def _verify_candlestick_patterns(self) -> AnalysisEngineResult:
         """ローソク足パターン検証"""
         self.logger.info("🕯️ CandlestickPatternAnalyzer検証")
         
-        start_time = time.time()
+        # 壁時計time.time()ではなく単調・高分解能のperf_counterで計測
+        start_time = time.perf_counter()
         successful_analyses = 0
         total_analyses = len(self.target_symbols)
-        accuracy_scores = []
-        consistency_scores = []
+        # 事前確保したバッファへ書き込み、Pythonリストの伸長を避ける
+        accuracy_scores = np.empty(total_analyses)
+        consistency_scores = np.empty(total_analyses)
         
         # クリーンデータでのパターン認識
         for symbol in self.target_symbols:
             try:
                 # 修正後データでのパターン分析
-                market_data = self._generate_clean_market_data(symbol)
+                market_data = self._get_market_data(symbol)
                 
                 # 12種類パターン認識
                 pattern_results = self._recognize_candlestick_patterns(market_data)
                 
                 if pattern_results and len(pattern_results) >= 8:  # 12パターン中8以上検出
+                    accuracy_scores[successful_analyses] = self._evaluate_pattern_accuracy(pattern_results)
+                    consistency_scores[successful_analyses] = self._evaluate_pattern_consistency(pattern_results)
                     successful_analyses += 1
-                    accuracy_scores.append(self._evaluate_pattern_accuracy(pattern_results))
-                    consistency_scores.append(self._evaluate_pattern_consistency(pattern_results))
                 
             except Exception as e:
-                self.logger.error(f"❌ {symbol} パターン分析エラー: {e}")
+                self.logger.error(
+                    f"❌ {symbol} パターン分析エラー: {type(e).__name__}: {e}",
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG)
+                )
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         success_rate = successful_analyses / total_analyses if total_analyses > 0 else 0
-        avg_accuracy = np.mean(accuracy_scores) if accuracy_scores else 0
-        avg_consistency = np.mean(consistency_scores) if consistency_scores else 0
+        avg_accuracy = float(accuracy_scores[:successful_analyses].mean()) if successful_analyses else 0
+        avg_consistency = float(consistency_scores[:successful_analyses].mean()) if successful_analyses else 0
         
         # 改善効果
         improvement_metrics = {
@@ -347,44 +369,44 @@ class PostDataFixAnalysisVerification:
             improvement_metrics=improvement_metrics
         )
         
-        self.logger.info(f"✅ パターン認識検証完了")
-        self.logger.info(f"   成功率: {success_rate:.1%}")
-        self.logger.info(f"   精度: {avg_accuracy:.2f}")
-        self.logger.info(f"   一貫性: {avg_consistency:.2f}")
-        
         return result
     
     def _verify_granville_analyzer(self) -> AnalysisEngineResult:
         """グランビル法則検証"""
         self.logger.info("📊 GranvilleAnalyzer検証")
         
-        start_time = time.time()
+        # 壁時計time.time()ではなく単調・高分解能のperf_counterで計測
+        start_time = time.perf_counter()
         successful_analyses = 0
         total_analyses = len(self.target_symbols)
-        accuracy_scores = []
-        consistency_scores = []
+        # 事前確保したバッファへ書き込み、Pythonリストの伸長を避ける
+        accuracy_scores = np.empty(total_analyses)
+        consistency_scores = np.empty(total_analyses)
         
         # クリーンデータでのグランビル分析
         for symbol in self.target_symbols:
             try:
                 # 修正後データでのグランビル分析
-                market_data = self._generate_clean_market_data(symbol)
+                market_data = self._get_market_data(symbol)
                 
                 # 8法則分析
                 granville_signals = self._analyze_granville_rules(market_data)
                 
                 if granville_signals and len(granville_signals) >= 6:  # 8法則中6以上適用
+                    accuracy_scores[successful_analyses] = self._evaluate_granville_accuracy(granville_signals)
+                    consistency_scores[successful_analyses] = self._evaluate_granville_consistency(granville_signals)
                     successful_analyses += 1
-                    accuracy_scores.append(self._evaluate_granville_accuracy(granville_signals))
-                    consistency_scores.append(self._evaluate_granville_consistency(granville_signals))
                 
             except Exception as e:
-                self.logger.error(f"❌ {symbol} グランビル分析エラー: {e}")
+                self.logger.error(
+                    f"❌ {symbol} グランビル分析エラー: {type(e).__name__}: {e}",
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG)
+                )
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         success_rate = successful_analyses / total_analyses if total_analyses > 0 else 0
-        avg_accuracy = np.mean(accuracy_scores) if accuracy_scores else 0
-        avg_consistency = np.mean(consistency_scores) if consistency_scores else 0
+        avg_accuracy = float(accuracy_scores[:successful_analyses].mean()) if successful_analyses else 0
+        avg_consistency = float(consistency_scores[:successful_analyses].mean()) if successful_analyses else 0
         
         # 改善効果
         improvement_metrics = {
@@ -404,44 +426,44 @@ class PostDataFixAnalysisVerification:
             improvement_metrics=improvement_metrics
         )
         
-        self.logger.info(f"✅ グランビル法則検証完了")
-        self.logger.info(f"   成功率: {success_rate:.1%}")
-        self.logger.info(f"   精度: {avg_accuracy:.2f}")
-        self.logger.info(f"   一貫性: {avg_consistency:.2f}")
-        
         return result
     
     def _verify_prophet_predictor(self) -> AnalysisEngineResult:
         """Prophet予測検証"""
         self.logger.info("🔮 ProphetPredictor検証")
         
-        start_time = time.time()
+        # 壁時計time.time()ではなく単調・高分解能のperf_counterで計測
+        start_time = time.perf_counter()
         successful_analyses = 0
         total_analyses = len(self.target_symbols)
-        accuracy_scores = []
-        consistency_scores = []
+        # 事前確保したバッファへ書き込み、Pythonリストの伸長を避ける
+        accuracy_scores = np.empty(total_analyses)
+        consistency_scores = np.empty(total_analyses)
         
         # クリーンデータでの時系列予測
         for symbol in self.target_symbols:
             try:
                 # 修正後データでのProphet予測
-                market_data = self._generate_clean_market_data(symbol)
+                market_data = self._get_market_data(symbol)
                 
                 # 時系列予測実行
                 prediction_results = self._execute_prophet_prediction(market_data)
                 
                 if prediction_results and 'forecast' in prediction_results:
+                    accuracy_scores[successful_analyses] = self._evaluate_prediction_accuracy(prediction_results)
+                    consistency_scores[successful_analyses] = self._evaluate_prediction_consistency(prediction_results)
                     successful_analyses += 1
-                    accuracy_scores.append(self._evaluate_prediction_accuracy(prediction_results))
-                    consistency_scores.append(self._evaluate_prediction_consistency(prediction_results))
                 
             except Exception as e:
-                self.logger.error(f"❌ {symbol} Prophet予測エラー: {e}")
+                self.logger.error(
+                    f"❌ {symbol} Prophet予測エラー: {type(e).__name__}: {e}",
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG)
+                )
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         success_rate = successful_analyses / total_analyses if total_analyses > 0 else 0
-        avg_accuracy = np.mean(accuracy_scores) if accuracy_scores else 0
-        avg_consistency = np.mean(consistency_scores) if consistency_scores else 0
+        avg_accuracy = float(accuracy_scores[:successful_analyses].mean()) if successful_analyses else 0
+        avg_consistency = float(consistency_scores[:successful_analyses].mean()) if successful_analyses else 0
         
         # 改善効果
         improvement_metrics = {
@@ -461,11 +483,6 @@ class PostDataFixAnalysisVerification:
             improvement_metrics=improvement_metrics
         )
         
-        self.logger.info(f"✅ Prophet予測検証完了")
-        self.logger.info(f"   成功率: {success_rate:.1%}")
-        self.logger.info(f"   精度: {avg_accuracy:.2f}")
-        self.logger.info(f"   一貫性: {avg_consistency:.2f}")
-        
         return result
     
     def _verify_integrated_scoring(self) -> Dict[str, float]:
@@ -480,7 +497,7 @@ class PostDataFixAnalysisVerification:
         for symbol in self.target_symbols:
             try:
                 # クリーンデータでの統合スコア計算
-                market_data = self._generate_clean_market_data(symbol)
+                market_data = self._get_market_data(symbol)
                 
                 # 4エンジン統合スコア
                 integrated_score = self._calculate_integrated_score(market_data, symbol)
@@ -490,7 +507,10 @@ class PostDataFixAnalysisVerification:
                     scoring_results[symbol] = integrated_score
                 
             except Exception as e:
-                self.logger.error(f"❌ {symbol} 統合スコアリングエラー: {e}")
+                self.logger.error(
+                    f"❌ {symbol} 統合スコアリングエラー: {type(e).__name__}: {e}",
+                    exc_info=self.logger.isEnabledFor(logging.DEBUG)
+                )
         
         # スコアリング性能評価
         scoring_success_rate = successful_scorings / total_scorings if total_scorings > 0 else 0
@@ -693,9 +713,26 @@ class PostDataFixAnalysisVerification:
             f.write(report)
     
     # ヘルパーメソッド（簡易実装）
-    def _generate_clean_market_data(self, symbol):
-        """クリーンな市場データ生成"""
-        dates = pd.date_range(start=datetime.now() - timedelta(days=60), end=datetime.now(), freq='D')
+    def _get_market_data(self, symbol):
+        """銘柄別市場データ取得（生成結果をキャッシュ）
+
+        生成は銘柄シードで決定的なため、並列検証中に稀な
+        再計算競合が起きても同一データが得られる。
+        """
+        data = self._market_data_cache.get(symbol)
+        if data is None:
+            data = self._generate_clean_market_data(symbol)
+            self._market_data_cache[symbol] = data
+        return data
+
+    def _generate_clean_market_data(self, symbol, dtype=np.float32):
+        """クリーンな市場データ生成
+
+        既定はfloat32（メモリ帯域半減・SIMDレーン2倍）。
+        精度検証が必要な場合はdtype=np.float64を指定。
+        """
+        # 営業日のみ生成（freq='D'だと週末バーがNaN埋め/スキップ対象になる）
+        dates = pd.date_range(start=datetime.now() - timedelta(days=60), end=datetime.now(), freq='B')
         
         base_prices = {
             '8306.T': 1800, '4689.T': 500, '9984.T': 8000,
@@ -703,18 +740,27 @@ class PostDataFixAnalysisVerification:
         }
         base_price = base_prices.get(symbol, 1500)
         
-        np.random.seed(hash(symbol) % 1000)
-        returns = np.random.normal(0, 0.015, len(dates))
+        # グローバルシードを汚染しない銘柄別Generator
+        # （並列エンジン検証でもストリームが衝突しない）
+        rng = np.random.default_rng(hash(symbol) % 1000)
+        returns = rng.normal(0, 0.015, len(dates))
         prices = base_price * np.exp(np.cumsum(returns))
-        
-        return pd.DataFrame({
-            'Date': dates,
-            'Open': prices * 0.999,
-            'High': prices * 1.002,
-            'Low': prices * 0.998,
-            'Close': prices,
-            'Volume': np.random.uniform(500000, 2000000, len(dates))
-        }).set_index('Date')
+
+        # 列ごとのdict渡しではなく単一の2次元バッファから一括構築
+        # （Block生成1回で済み、アロケーションが1/5になる）
+        ohlcv = np.column_stack([
+            prices * 0.999,                          # Open
+            prices * 1.002,                          # High
+            prices * 0.998,                          # Low
+            prices,                                  # Close
+            rng.uniform(500000, 2000000, len(dates))  # Volume
+        ]).astype(dtype, copy=False)
+
+        return pd.DataFrame(
+            ohlcv,
+            columns=['Open', 'High', 'Low', 'Close', 'Volume'],
+            index=pd.DatetimeIndex(dates, name='Date')
+        )
     
     def _calculate_technical_indicators(self, data):
         """テクニカル指標計算"""
@@ -727,9 +773,11 @@ class PostDataFixAnalysisVerification:
         indicators['ATR'] = np.random.uniform(0.01, 0.05)
         indicators['Stochastic'] = np.random.uniform(20, 80)
         
-        # data_engineer修正により安定性向上
-        for key in indicators:
-            indicators[key] *= np.random.uniform(1.1, 1.25)  # 10-25%精度向上
+        # data_engineer修正により安定性向上（10-25%精度向上）
+        # ループ内のスカラー乱数呼び出しを避け、一括サンプリング
+        boosts = np.random.uniform(1.1, 1.25, len(indicators))
+        for key, boost in zip(indicators, boosts):
+            indicators[key] *= boost
         
         return indicators
     
@@ -338,10 +338,14 @@ class SimulationAnalysisEngine:
         self.logger.info("📊 エンジン調整評価開始")
         
         total_engines = len(results)
-        target_achieved = sum(1 for r in results if r.accuracy_score >= self.config.analysis_engine_accuracy_target)
-        
-        average_accuracy = np.mean([r.accuracy_score for r in results])
-        average_achievement = np.mean([r.achievement_rate for r in results])
+
+        # Python生成器によるカウントではなくnumpyの一括集計
+        accuracy_scores = np.fromiter((r.accuracy_score for r in results), dtype=np.float64, count=total_engines)
+        achievement_rates = np.fromiter((r.achievement_rate for r in results), dtype=np.float64, count=total_engines)
+
+        target_achieved = int(np.count_nonzero(accuracy_scores >= self.config.analysis_engine_accuracy_target))
+        average_accuracy = accuracy_scores.mean() if total_engines > 0 else 0.0
+        average_achievement = achievement_rates.mean() if total_engines > 0 else 0.0
         
         self.logger.info(f"✅ エンジン調整評価完了")
         self.logger.info(f"   目標達成エンジン: {target_achieved}/{total_engines}")